@@ -1,3 +1,6 @@
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .data import _AkariData as AkariData
 from .data import _AkariDataModuleType as AkariDataModuleType
 from .data import _AkariDataSet as AkariDataSet
@@ -8,8 +11,15 @@ from .logger import _getLogger as getLogger
 from .module import _AkariModule as AkariModule
 from .module import _AkariModuleParams as AkariModuleParams
 from .module import _AkariModuleType as AkariModuleType
-from .router import _AkariRouter as AkariRouter
-from .router import _AkariRouterLoggerOptions as AkariRouterLoggerOptions
+
+if TYPE_CHECKING:
+    from .router import _AkariRouter as AkariRouter
+    from .router import _AkariRouterLoggerOptions as AkariRouterLoggerOptions
+
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str]] = {
+    "AkariRouter": (".router", "_AkariRouter"),
+    "AkariRouterLoggerOptions": (".router", "_AkariRouterLoggerOptions"),
+}
 
 __all__ = [
     "AkariData",
@@ -25,3 +35,25 @@ __all__ = [
     "AkariLogger",
     "getLogger",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolves the router exports on first access so that importing `akari` does not load the router module.
+
+    Args:
+        name (str): The attribute being looked up on the `akari` package.
+
+    Returns:
+        Any: The exported object. It is cached in the package namespace, so
+        later lookups bypass this function.
+
+    Raises:
+        AttributeError: If `name` is not a lazily exported attribute.
+    """
+    target = _LAZY_ATTRIBUTES.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = target
+    value = getattr(importlib.import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
@@ -1,31 +1,87 @@
+import builtins
+import collections
 import dataclasses
-from typing import Any, Dict, Generic, TypeVar
+import types
+from typing import (
+    Any,
+    Generic,
+    Iterable,
+    Iterator,
+    Mapping,
+    TypeVar,
+    cast,
+)
 
 from akari.module import _AkariModuleParams, _AkariModuleType
 
 T = TypeVar("T")
 
+_EMPTY: Mapping[str, Any] = types.MappingProxyType({})
+
+
+def _summarize(value: object) -> str:
+    """Renders a value for `repr`, eliding the contents of text and binary payloads.
+
+    Args:
+        value (object): The value to render.
+
+    Returns:
+        str: The type name and length for `str`, `bytes`, `bytearray` and
+        `memoryview` values, and the regular `repr` for anything else.
+    """
+    if isinstance(value, (str, bytes, bytearray, memoryview)):
+        return f"{type(value).__name__}(len={len(value)})"
+    return repr(value)
+
 
 class _AkariDataStreamType(Generic[T]):
     """Manages a sequence of data points, typically representing deltas or chunks within a stream.
 
     Allows for typed data streams, ensuring that all elements within a stream
     are of a consistent type. Provides basic operations like accessing the last
-    element, getting the length, and retrieving elements by index.
+    element, appending new elements, getting the length, and retrieving elements
+    by index. A long-running producer can pass `maxlen` to retain only the
+    most recent data points, so its stream does not grow without bound.
 
     Attributes:
-        _delta (list[T]): Stores the sequence of data points. The name `_delta`
-            suggests that these points might represent changes or increments,
+        _delta (collections.deque[T]): Stores the sequence of data points. The name
+            `_delta` suggests that these points might represent changes or increments,
             but it can hold any sequence of data.
     """
 
-    def __init__(self, delta: list[T]) -> None:
+    __slots__ = ("_delta",)
+
+    def __init__(self, delta: Iterable[T], maxlen: int | None = None) -> None:
         """Constructs a new data stream instance.
 
         Args:
-            delta (list[T]): The initial list of data points to populate the stream.
+            delta (Iterable[T]): The initial data points to populate the stream.
+                They are copied into the stream, so later changes to the source
+                collection are not reflected.
+            maxlen (Optional[int]): The maximum number of data points kept in the
+                stream. Older points are discarded as new ones are appended.
+                Defaults to None, which keeps every data point.
         """
-        self._delta = delta
+        self._delta: collections.deque[T] = collections.deque(delta, maxlen=maxlen)
+
+    def append(self, value: T) -> None:
+        """Adds a data point to the end of the stream.
+
+        If the stream was created with `maxlen` and already holds that many data
+        points, the oldest one is discarded.
+
+        Args:
+            value (T): The data point to append.
+        """
+        self._delta.append(value)
+
+    def clone(self) -> "_AkariDataStreamType[T]":
+        """Creates a copy of this stream that can be appended to independently.
+
+        Returns:
+            _AkariDataStreamType[T]: A new stream with the same data points and length bound.
+        """
+        return _AkariDataStreamType(self._delta, maxlen=self._delta.maxlen)
 
     def last(self) -> T:
         """Fetches the most recently added data point in the stream.
@@ -36,9 +92,10 @@ class _AkariDataStreamType(Generic[T]):
         Raises:
             IndexError: If the stream contains no elements.
         """
-        if not self._delta:
-            raise IndexError("No history available")
-        return self._delta[-1]
+        try:
+            return self._delta[-1]
+        except IndexError:
+            raise IndexError("No history available") from None
 
     def __len__(self) -> int:
         """Computes the total number of data points currently in the stream.
@@ -58,25 +115,31 @@ class _AkariDataStreamType(Generic[T]):
             T: The data point located at the specified index.
 
         Raises:
-            IndexError: If the provided index is outside the valid range of the stream.
+            IndexError: If the provided index is negative or outside the valid range of the stream.
         """
-        if index < 0 or index >= len(self._delta):
+        if index < 0:
             raise IndexError("Index out of range")
-        return self._delta[index]
+        try:
+            return self._delta[index]
+        except IndexError:
+            raise IndexError("Index out of range") from None
 
     def __repr__(self) -> str:
         """Generates a developer-friendly string representation of the data stream.
 
+        The data points themselves are not rendered, since a stream may hold a
+        large number of sizeable chunks.
+
         Returns:
-            str: A string showing the class name and the internal delta list.
+            str: A string showing the class name and the number of data points.
         """
-        return f"AkariDataStreamType(delta={self._delta})"
+        return f"AkariDataStreamType(len={len(self._delta)})"
 
     def __eq__(self, value: object) -> bool:
         """Determines if this data stream is equivalent to another object.
 
         Equality is based on whether the other object is also an `_AkariDataStreamType`
-        and if their internal `_delta` lists are identical.
+        and if their internal `_delta` sequences hold equal elements.
 
         Args:
             value (object): The object to compare against this stream.
@@ -89,12 +152,13 @@ class _AkariDataStreamType(Generic[T]):
         return self._delta == value._delta
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class _AkariDataModuleType:
     """Encapsulates metadata detailing the execution context of an Akari module that generated a specific dataset.
 
     Provides crucial information for tracing data provenance and understanding
-    the pipeline's behavior.
+    the pipeline's behavior. Instances are immutable; use `dataclasses.replace`
+    to derive a copy with updated fields.
 
     Attributes:
         moduleType: The specific type (class) of the Akari module that was executed.
@@ -102,25 +166,105 @@ class _AkariDataModuleType:
         streaming (bool): Indicates if the module was invoked in a streaming context.
         callback (Optional[_AkariModuleType]): The type of the callback module, if one was
             configured for the executed module.
-        startTime (float): The timestamp (from `time.process_time()`) marking the
-            beginning of the module's execution.
-        endTime (float): The timestamp (from `time.process_time()`) marking the
-            completion of the module's execution.
+        startTime (int): The timestamp in nanoseconds (from `time.perf_counter_ns()`)
+            marking the beginning of the module's execution.
+        endTime (int): The timestamp in nanoseconds (from `time.perf_counter_ns()`)
+            marking the completion of the module's execution.
     """
 
     moduleType: _AkariModuleType
     params: _AkariModuleParams
     streaming: bool
     callback: _AkariModuleType | None
-    startTime: float
-    endTime: float
+    startTime: int
+    endTime: int
+
+
+class _AkariOthers(Mapping[str, T]):
+    """A compact, insertion-ordered mapping backing `_AkariDataSetType.others`.
+
+    `others` typically holds only a handful of named values, so entries are kept
+    as a flat list of `(key, value)` pairs and looked up by linear scan. For such
+    small sizes this is both smaller and faster than a `dict`.
+
+    Attributes:
+        _items (list[tuple[str, T]]): The stored key/value pairs in insertion order.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: Iterable[tuple[str, T]] = ()) -> None:
+        """Constructs a new mapping from key/value pairs.
+
+        Args:
+            items (Iterable[tuple[str, T]]): Initial key/value pairs. Later pairs
+                replace earlier pairs with the same key.
+        """
+        self._items: list[tuple[str, T]] = []
+        for key, value in items:
+            self.set(key, value)
+
+    def set(self, key: str, value: T) -> None:
+        """Stores `value` under `key`, replacing any existing entry in place.
+
+        Args:
+            key (str): The name of the data point.
+            value (T): The data point to store.
+        """
+        items = self._items
+        for i, (k, _) in enumerate(items):
+            if k == key:
+                items[i] = (key, value)
+                return
+        items.append((key, value))
+
+    def __getitem__(self, key: str) -> T:
+        """Looks up the value stored under `key`.
+
+        Args:
+            key (str): The name of the data point.
+
+        Returns:
+            T: The stored value.
+
+        Raises:
+            KeyError: If no value is stored under `key`.
+        """
+        for k, v in self._items:
+            if k == key:
+                return v
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the stored keys in insertion order.
+
+        Returns:
+            Iterator[str]: An iterator over the keys.
+        """
+        return (k for k, _ in self._items)
+
+    def __len__(self) -> int:
+        """Returns the number of stored entries.
+
+        Returns:
+            int: The number of entries.
+        """
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        """Generates a developer-friendly string representation of the mapping.
+
+        Returns:
+            str: A string showing the stored key/value pairs.
+        """
+        return f"AkariOthers({self._items!r})"
 
 
 class _AkariDataSetType(Generic[T]):
     """Provides a structured container for a specific type of data within an AkariDataSet.
 
     It holds a primary data payload (`main`), an optional associated stream
-    (`stream`), and a dictionary for any other related data points (`others`).
+    (`stream`), and a mapping for any other related data points (`others`).
     This generic class allows for type safety for these components.
 
     Attributes:
@@ -128,12 +272,16 @@ class _AkariDataSetType(Generic[T]):
         stream (Optional[_AkariDataStreamType[T]]): An optional stream of data related
             to `main`. For instance, if `main` is a complete audio transcription,
             `stream` might contain incremental speech segments.
-        others (Dict[str, T]): A dictionary for storing additional, named data points
-            of the same type `T` that are contextually related to `main`.
+        others (Mapping[str, T]): A mapping for storing additional, named data points
+            of the same type `T` that are contextually related to `main`. When no
+            such data points exist, this is a shared read-only empty mapping; use
+            `set_other` to add entries.
     """
 
+    __slots__ = ("main", "stream", "others")
+
     def __init__(
-        self, main: T, stream: _AkariDataStreamType[T] | None = None, others: Dict[str, T] | None = None
+        self, main: T, stream: _AkariDataStreamType[T] | None = None, others: Mapping[str, T] | None = None
     ) -> None:
         """Constructs a new typed data set.
 
@@ -141,20 +289,66 @@ class _AkariDataSetType(Generic[T]):
             main (T): The primary data point for this set.
             stream (Optional[_AkariDataStreamType[T]]): An optional stream of related
                 data points. Defaults to None if not provided.
-            others (Optional[Dict[str, T]]): A dictionary of other named data points
-                of the same type `T`. Defaults to an empty dictionary if not provided.
+            others (Optional[Mapping[str, T]]): A mapping of other named data points
+                of the same type `T`. Defaults to a shared empty mapping if not provided.
         """
         self.main = main
         self.stream = stream
-        self.others = others if others is not None else {}
+        self.others: Mapping[str, T] = others if others is not None else _EMPTY
+
+    def set_other(self, key: str, value: T) -> None:
+        """Stores an additional named data point in `others`.
+
+        On the first write, the shared empty mapping (or a mapping passed to the
+        constructor) is replaced by a compact `_AkariOthers` owned by this instance.
+
+        Args:
+            key (str): The name of the data point.
+            value (T): The data point to store.
+        """
+        others = self.others
+        if not isinstance(others, _AkariOthers):
+            others = self.others = _AkariOthers(others.items())
+        others.set(key, value)
+
+    def clone(self) -> "_AkariDataSetType[T]":
+        """Creates a copy of this typed data set that can be modified independently.
+
+        `stream` and `others` are copied, and a `dict`, `list` or `bytearray` in
+        `main` is copied shallowly, so appending to the stream, calling
+        `set_other` or updating a metadata dictionary on the copy leaves this set
+        untouched. Immutable payloads such as `str` and `bytes` are shared.
+
+        Returns:
+            _AkariDataSetType[T]: The copied typed data set.
+        """
+        main: Any = self.main
+        if isinstance(main, (dict, list, bytearray)):
+            main = main.copy()
+        stream = self.stream
+        others = self.others
+        return _AkariDataSetType(
+            main,
+            stream.clone() if stream is not None else None,
+            others if others is _EMPTY else _AkariOthers(others.items()),
+        )
 
     def __repr__(self) -> str:
         """Generates a developer-friendly string representation of the typed data set.
 
+        Text and binary payloads are summarized by type and length instead of
+        being rendered in full, and `stream` and `others` are only shown when set.
+
         Returns:
-            str: A string showing the class name and its `main`, `stream`, and `others` attributes.
+            str: A string showing the class name and a summary of its `main`, `stream`,
+            and `others` attributes.
         """
-        return f"AkariDataSetType(main={self.main}, stream={self.stream}, others={self.others})"
+        parts = [f"main={_summarize(self.main)}"]
+        if self.stream is not None:
+            parts.append(f"stream={self.stream!r}")
+        if self.others:
+            parts.append(f"others={sorted(self.others)}")
+        return f"AkariDataSetType({', '.join(parts)})"
 
     def __eq__(self, value: object) -> bool:
         """Determines if this typed data set is equivalent to another object.
@@ -173,34 +367,36 @@ class _AkariDataSetType(Generic[T]):
         return self.main == value.main and self.stream == value.stream and self.others == value.others
 
 
+@dataclasses.dataclass(slots=True, eq=False, kw_only=True)
 class _AkariDataSet:
     """Aggregates various types of data (text, audio, boolean, metadata) produced by a single module execution.
 
     It also stores metadata about the module execution itself. This class acts as a
     standardized container for data passed between modules in an Akari pipeline.
+    Every field defaults to None and can be given as a keyword argument at
+    construction time or assigned afterwards. Equality is identity-based.
 
     Attributes:
-        module (_AkariDataModuleType): Metadata about the module that generated this dataset.
-            This is typically set by the AkariRouter after a module executes.
         text (Optional[_AkariDataSetType[str]]): Holds string-based data.
         audio (Optional[_AkariDataSetType[bytes]]): Holds byte-based audio data.
         bool (Optional[_AkariDataSetType[bool]]): Holds boolean data.
         meta (Optional[_AkariDataSetType[dict[str, Any]]]): Holds dictionary-based
             metadata, often used for details like audio sampling rates or content types.
-        allData (Any | None): A flexible field for storing any other type of data
+        allData (object | None): A flexible field for storing any other type of data
             that doesn't fit the predefined categories, such as raw API responses.
+            Its type is opaque to the framework, so consumers must narrow it
+            (e.g., with `isinstance`) before use.
+        module (_AkariDataModuleType): Metadata about the module that generated this dataset.
+            This is typically set by the AkariRouter after a module executes.
     """
 
+    text: _AkariDataSetType[str] | None = None
+    audio: _AkariDataSetType[bytes] | None = None
+    bool: _AkariDataSetType[builtins.bool] | None = None
+    meta: _AkariDataSetType[dict[str, Any]] | None = None
+    allData: object | None = dataclasses.field(default=None, repr=False)
     module: _AkariDataModuleType | None = None
 
-    def __init__(self) -> None:
-        """Constructs an empty AkariDataSet, ready to be populated by a module."""
-        self.text: _AkariDataSetType[str] | None = None
-        self.audio: _AkariDataSetType[bytes] | None = None
-        self.bool: _AkariDataSetType[bool] | None = None
-        self.meta: _AkariDataSetType[dict[str, Any]] | None = None
-        self.allData: Any | None = None
-
     def setModule(self, module: _AkariDataModuleType) -> None:
         """Attaches module execution metadata to this dataset.
 
@@ -214,6 +410,25 @@ class _AkariDataSet:
         """
         self.module = module
 
+    def clone(self) -> "_AkariDataSet":
+        """Creates a shallow copy of this dataset.
+
+        The copy refers to the same typed data sets and payloads as this dataset,
+        so assigning a field on one does not affect the other, but mutating a
+        shared payload in place does.
+
+        Returns:
+            _AkariDataSet: A new dataset with the same field values.
+        """
+        return _AkariDataSet(
+            text=self.text,
+            audio=self.audio,
+            bool=self.bool,
+            meta=self.meta,
+            allData=self.allData,
+            module=self.module,
+        )
+
 
 class _AkariData:
     """Orchestrates a sequence of datasets, representing the state and flow of data through an Akari processing pipeline.
@@ -223,21 +438,106 @@ class _AkariData:
     instances to it as they produce results.
 
     Attributes:
-        datasets (list[_AkariDataSet]): An ordered list of datasets. New datasets
-            are appended to the end of this list.
+        _datasets (list[Optional[_AkariDataSet]]): The stored datasets in order,
+            followed by any unused slots preallocated by `reserve`.
+        _count (int): The number of datasets actually stored in `_datasets`.
+        _last (Optional[_AkariDataSet]): The most recently added dataset, kept so
+            that `last` does not have to index into `_datasets`.
     """
 
+    __slots__ = ("_datasets", "_count", "_last")
+
     def __init__(self) -> None:
         """Constructs an AkariData instance with an initially empty list of datasets."""
-        self.datasets: list[_AkariDataSet] = []
+        self._datasets: list[_AkariDataSet | None] = []
+        self._count = 0
+        self._last: _AkariDataSet | None = None
+
+    @property
+    def datasets(self) -> list[_AkariDataSet]:
+        """A copy of the ordered list of stored datasets.
+
+        Reserved slots are left out and kept for later `add` calls. Changing
+        the returned list does not affect this sequence; use `add` to append,
+        or assign a new list to replace the stored datasets.
+
+        Returns:
+            list[_AkariDataSet]: The stored datasets, oldest first.
+        """
+        return cast(list[_AkariDataSet], self._datasets[: self._count])
+
+    @datasets.setter
+    def datasets(self, datasets: list[_AkariDataSet]) -> None:
+        """Replaces the stored datasets, dropping any reserved slots.
+
+        Args:
+            datasets (list[_AkariDataSet]): The new datasets, oldest first.
+        """
+        self._datasets = cast(list[_AkariDataSet | None], list(datasets))
+        self._count = len(datasets)
+        self._last = datasets[-1] if datasets else None
+
+    def reserve(self, n: int) -> None:
+        """Preallocates room for a total of `n` datasets so that subsequent `add` calls do not resize the list.
+
+        Useful when the number of datasets a pipeline will produce is known in
+        advance. Reserving fewer slots than are already in use has no effect.
+        The reserved slots are internal and never appear in `datasets`.
+
+        Args:
+            n (int): The total number of datasets the sequence should be able to
+                hold without growing.
+        """
+        extra = n - len(self._datasets)
+        if extra > 0:
+            self._datasets.extend([None] * extra)
+
+    def clone(self) -> "_AkariData":
+        """Creates a copy of this sequence that a module can modify without affecting this one.
+
+        Every stored dataset is copied together with its typed data sets (see
+        `_AkariDataSetType.clone`), so adding datasets to the copy, assigning
+        dataset fields, appending to streams, calling `set_other` or updating
+        metadata dictionaries leaves this sequence untouched. Immutable payloads,
+        `allData` and module metadata are shared; `allData` must be treated as
+        read-only. Reserved slots are not copied.
+
+        Returns:
+            _AkariData: The copied sequence.
+        """
+        result = _AkariData()
+        count = self._count
+        datasets = [
+            _AkariDataSet(
+                text=dataset.text.clone() if dataset.text is not None else None,
+                audio=dataset.audio.clone() if dataset.audio is not None else None,
+                bool=dataset.bool.clone() if dataset.bool is not None else None,
+                meta=dataset.meta.clone() if dataset.meta is not None else None,
+                allData=dataset.allData,
+                module=dataset.module,
+            )
+            for dataset in cast(list[_AkariDataSet], self._datasets[:count])
+        ]
+        result._datasets = cast(list[_AkariDataSet | None], datasets)
+        result._count = count
+        result._last = datasets[count - 1] if count else None
+        return result
 
     def add(self, dataset: _AkariDataSet) -> None:
         """Appends a new dataset to the end of the current sequence.
 
+        Fills the next reserved slot when one is available, and grows the list
+        otherwise.
+
         Args:
             dataset (_AkariDataSet): The dataset to be added.
         """
-        self.datasets.append(dataset)
+        if self._count < len(self._datasets):
+            self._datasets[self._count] = dataset
+        else:
+            self._datasets.append(dataset)
+        self._count += 1
+        self._last = dataset
 
     def get(self, index: int) -> _AkariDataSet:
         """Fetches a dataset from the sequence by its zero-based index.
@@ -251,9 +551,9 @@ class _AkariData:
         Raises:
             IndexError: If the index is outside the valid range of the dataset list.
         """
-        if index < 0 or index >= len(self.datasets):
-            raise IndexError("Index out of range")
-        return self.datasets[index]
+        if 0 <= index < self._count:
+            return cast(_AkariDataSet, self._datasets[index])
+        raise IndexError("Index out of range")
 
     def last(self) -> _AkariDataSet:
         """Accesses the most recently added dataset in the sequence.
@@ -264,9 +564,10 @@ class _AkariData:
         Raises:
             IndexError: If the list of datasets is empty.
         """
-        if not self.datasets:
+        dataset = self._last
+        if dataset is None:
             raise IndexError("No datasets available")
-        return self.datasets[-1]
+        return dataset
 
     def __getitem__(self, index: int) -> _AkariDataSet:
         """Enables dataset retrieval using subscript notation (e.g., `akari_data[i]`).
@@ -285,4 +586,4 @@ class _AkariData:
         Returns:
             int: The count of datasets.
         """
-        return len(self.datasets)
+        return self._count
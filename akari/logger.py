@@ -3,29 +3,53 @@ import sys
 
 _AkariLogger = logging.Logger
 
+_LIBRARY_LOGGER_NAME = "Akari"
 
-def _getLogger(name: str, level: int = logging.DEBUG) -> _AkariLogger:
+_SHARED_HANDLER = logging.StreamHandler(sys.stdout)
+_SHARED_HANDLER.setLevel(logging.DEBUG)
+
+# ライブラリとして組み込まれた場合は、明示的に要求されない限り何も出力しない
+_NULL_HANDLER = logging.NullHandler()
+logging.getLogger(_LIBRARY_LOGGER_NAME).addHandler(_NULL_HANDLER)
+
+
+def _getLogger(name: str, level: int = logging.DEBUG, stream: bool = True) -> _AkariLogger:
     """Sets up and provides a customized logger instance for use within the Akari framework.
 
-    Creates a logger with the specified name and severity level. To prevent
-    "No handlers could be found" warnings if the application using Akari doesn't
-    configure logging, a `NullHandler` is added by default. Additionally, a
-    `StreamHandler` is configured to output log messages to `sys.stdout`,
-    using the same specified logging level.
+    Creates a logger with the specified name and severity level. When `stream`
+    is True, the module-level `StreamHandler` that outputs log messages to
+    `sys.stdout` is attached. All Akari loggers share that single handler, so
+    filtering by severity is done by the logger's own level. The handler is only
+    attached once per logger and propagation to the root logger is disabled, so
+    requesting the same logger repeatedly never duplicates output. When `stream`
+    is False, the shared handler is detached if present and records propagate
+    to the embedding application's handlers; the "Akari" library logger carries
+    a `NullHandler` so that nothing is printed if the application configures
+    none. Every call reapplies `level` and `stream`, so the returned logger
+    always reflects the latest request for its name.
 
     Args:
         name (str): The desired name for the logger (e.g., "Akari.Router").
         level (int): The minimum logging level the logger will handle (e.g.,
             `logging.DEBUG`, `logging.INFO`). Defaults to `logging.DEBUG`.
+        stream (bool): Whether to write the logger's records to `sys.stdout`.
+            Defaults to True.
 
     Returns:
         _AkariLogger: The fully configured logger instance.
     """
     logger = logging.getLogger(name)
     logger.setLevel(level)
-    logger.addHandler(logging.NullHandler())
 
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(level)
-    logger.addHandler(handler)
+    if stream:
+        logger.propagate = False
+        if _SHARED_HANDLER not in logger.handlers:
+            # 標準出力に書き出す場合、NullHandler は不要
+            logger.removeHandler(_NULL_HANDLER)
+            logger.addHandler(_SHARED_HANDLER)
+    elif _SHARED_HANDLER in logger.handlers:
+        logger.removeHandler(_SHARED_HANDLER)
+        logger.propagate = True
+        if name == _LIBRARY_LOGGER_NAME:
+            logger.addHandler(_NULL_HANDLER)
     return logger
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+import logging
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import akari.data as akari_data
 import akari.logger as logger
@@ -13,7 +13,7 @@ _AkariModuleParams = Any
 _AkariModuleType = type["_AkariModule"]
 
 
-class _AkariModule(ABC):
+class _AkariModule:
     """Defines the foundational contract for all processing units (modules) within the Akari framework.
 
     Establishes the essential structure and behavior expected of any module.
@@ -21,27 +21,64 @@ class _AkariModule(ABC):
     the router and logger, and the two primary modes of operation: a standard
     blocking call and a streaming call. Subclasses must implement `call` and
     can optionally override `stream_call` if streaming capabilities are required.
+    The `call` requirement is checked when a subclass is defined, so this is a
+    plain class rather than an `ABC`. An intermediate base class that leaves
+    `call` to its own subclasses declares itself with `abstract=True` in its
+    class statement (e.g. `class _Base(AkariModule, abstract=True)`).
 
     Attributes:
         _router (router._AkariRouter): Provides access to the Akari router, enabling
             this module to call other modules and navigate the pipeline.
-        _logger (logger._AkariLogger): A dedicated logger instance for this module,
-            allowing for contextualized logging of its operations and state.
+        _logger (logger._AkariLogger): The logger for this module, allowing for
+            contextualized logging of its operations and state. Unless a logger is
+            passed to the constructor, this is the class-level `_classLogger`.
+        _classLogger (logger._AkariLogger): The logger shared by all instances of a
+            module class, named "Akari.<ClassName>" and created once per subclass.
+        requires_isolation (bool): Whether the router must pass this module a
+            copy of its input `data` rather than the caller's object. Defaults to
+            True, so a module may add datasets to its input or modify the datasets
+            in it without affecting the caller. Modules that never modify the data
+            they receive may set this to False to skip the copy.
     """
 
-    def __init__(self, router: router._AkariRouter, logger: logger._AkariLogger) -> None:
+    __slots__ = ("_router", "_logger")
+
+    requires_isolation: ClassVar[bool] = True
+
+    _classLogger: ClassVar[logger._AkariLogger] = logger._getLogger("Akari.Module", logging.NOTSET, stream=False)
+
+    def __init_subclass__(cls, abstract: bool = False, **kwargs: Any) -> None:
+        """Verifies that a newly defined subclass implements `call` and creates its class-level logger.
+
+        The logger is a child of the "Akari" logger with no level of its own, so
+        it inherits that logger's level and handlers unless configured otherwise.
+
+        Args:
+            abstract (bool): Whether the subclass is an intermediate base class
+                that may leave `call` to its own subclasses. Defaults to False.
+            **kwargs (Any): Keyword arguments forwarded to `object.__init_subclass__`.
+
+        Raises:
+            TypeError: If a subclass not declared abstract does not override `call`.
+        """
+        super().__init_subclass__(**kwargs)
+        if not abstract and cls.call is _AkariModule.call:
+            raise TypeError(f"{cls.__name__} must override call.")
+        cls._classLogger = logger._getLogger(f"Akari.{cls.__name__}", logging.NOTSET, stream=False)
+
+    def __init__(self, router: router._AkariRouter, logger: logger._AkariLogger | None = None) -> None:
         """Constructs a new Akari module instance, equipping it with essential framework components.
 
         Args:
             router (router._AkariRouter): The central Akari router instance, facilitating
                 inter-module communication and pipeline orchestration.
-            logger (logger._AkariLogger): The logger instance specifically configured
-                for this module, used for recording events and debugging.
+            logger (Optional[logger._AkariLogger]): A logger to use for this instance
+                instead of the class-level logger. Defaults to None, in which case
+                the class-level logger is used.
         """
         self._router = router
-        self._logger = logger
+        self._logger = logger if logger is not None else self._classLogger
 
-    @abstractmethod
     def call(
         self, data: akari_data._AkariData, params: _AkariModuleParams, callback: _AkariModuleType | None = None
     ) -> akari_data._AkariDataSet | akari_data._AkariData:
@@ -66,8 +103,11 @@ class _AkariModule(ABC):
             the module's processing. This can be a single `_AkariDataSet` if the
             module produces one distinct set of results, or an `_AkariData` instance
             if the module modifies the overall data pipeline or produces multiple datasets.
+
+        Raises:
+            NotImplementedError: Always; subclasses must override this method.
         """
-        pass
+        raise NotImplementedError("call must be overridden in this module.")
 
     def stream_call(
         self, data: akari_data._AkariData, params: _AkariModuleParams, callback: _AkariModuleType | None = None
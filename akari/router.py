@@ -1,31 +1,123 @@
-import copy
-import dataclasses
+import asyncio
+import contextlib
+import logging
 import os
-import threading  # 追加
+import threading
 import time
-from typing import Dict, cast
+from typing import Callable, ClassVar, Dict, Iterator, NamedTuple, cast
 
 import akari.data as akari_data
 import akari.logger as logger
 import akari.module as module
 
+# モジュールの call / stream_call の束縛メソッドの型
+_ModuleCall = Callable[
+    [akari_data._AkariData, module._AkariModuleParams, module._AkariModuleType | None],
+    akari_data._AkariDataSet | akari_data._AkariData,
+]
 
-@dataclasses.dataclass
-class _AkariRouterLoggerOptions:
+# 結果の型判定に使うクラス (呼び出しごとの属性参照を避ける)
+_DATASET_T = akari_data._AkariDataSet
+_DATA_T = akari_data._AkariData
+
+# 時刻計測関数 (ナノ秒単位の整数を返す)
+_perf = time.perf_counter_ns
+
+# ログ出力用のプロセスID。fork 後の子プロセスでは再取得する
+_PID = os.getpid()
+
+
+def _refreshPid() -> None:
+    """Re-reads the cached process ID after the process has forked."""
+    global _PID
+    _PID = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_refreshPid)
+
+
+class _AkariRouterLoggerOptions(NamedTuple):
     """Specifies logging preferences for the AkariRouter.
 
-    Controls the verbosity of informational messages and the tracking of
-    module execution durations.
+    Controls the verbosity of informational messages, the tracking of module
+    execution durations, and whether execution metadata is recorded at all.
+    Instances are immutable tuples.
 
     Attributes:
         info (bool): Enables or disables logging of general informational messages
             during router operations. Defaults to False.
         duration (bool): Enables or disables logging of the execution time for
-            each called module. Defaults to False.
+            each called module. Defaults to False. When enabled, the duration
+            message also carries the process and thread IDs, so no separate
+            informational message is emitted for the call.
+        record_timings (bool): Enables or disables recording of execution metadata
+            (`_AkariDataModuleType`, including start and end times) on the datasets
+            produced by each called module. Disabling it skips all timing work in
+            the router. It is always treated as enabled when `duration` is set.
+            Defaults to True.
     """
 
     info: bool = False
     duration: bool = False
+    record_timings: bool = True
+
+
+class _AkariStreamScope:
+    """Feeds successive chunks of a stream to a single module without per-chunk bookkeeping.
+
+    Obtained from `_AkariRouter.streamScope`. Each `call` forwards one chunk to
+    the module's `stream_call` and merges the result into the data it was given,
+    but no execution metadata, timing or logging is recorded per chunk; the
+    router attaches a single `_AkariDataModuleType` covering the whole stream
+    when the scope exits.
+
+    Attributes:
+        last (Optional[akari_data._AkariData]): The data returned by the most
+            recent `call`, or None if no chunk has been processed yet.
+    """
+
+    __slots__ = ("_stream_fn", "_params", "_callback", "last")
+
+    def __init__(
+        self, stream_fn: _ModuleCall, params: module._AkariModuleParams, callback: module._AkariModuleType | None
+    ) -> None:
+        """Constructs a stream scope bound to one module's `stream_call`.
+
+        Args:
+            stream_fn (_ModuleCall): The module's bound `stream_call` method.
+            params (module._AkariModuleParams): The parameters passed with every chunk.
+            callback (Optional[module._AkariModuleType]): The callback module passed
+                with every chunk.
+        """
+        self._stream_fn = stream_fn
+        self._params = params
+        self._callback = callback
+        self.last: akari_data._AkariData | None = None
+
+    def call(self, data: akari_data._AkariData) -> akari_data._AkariData:
+        """Processes one chunk of the stream.
+
+        Args:
+            data (akari_data._AkariData): The data holding the chunk to process.
+
+        Returns:
+            akari_data._AkariData: `data` with the module's dataset appended if the
+            module returned a dataset, or the `_AkariData` the module returned.
+
+        Raises:
+            ValueError: If the module returns a result of an unexpected type.
+        """
+        result = self._stream_fn(data, self._params, self._callback)
+        if isinstance(result, _DATASET_T):
+            data.add(result)
+            out = data
+        elif isinstance(result, _DATA_T):
+            out = result
+        else:
+            raise ValueError(f"Invalid result type: {type(result)}")
+        self.last = out
+        return out
 
 
 class _AkariRouter:
@@ -37,6 +129,15 @@ class _AkariRouter:
     module execution, such as timing and parameters used.
     """
 
+    __slots__ = ("_modules", "_sealed", "_logger", "_options", "_logging", "_record", "_tls")
+
+    # ログのフォーマット文字列と、streaming フラグで引く呼び出し種別
+    _INFO_FMT: ClassVar[str] = "[Router] Module %s (PID: %s, ThreadID: %s): %s"
+    _DURATION_FMT: ClassVar[str] = (
+        "[Router] Module %s: %s (PID: %s, ThreadID: %s) took %.2f ms (elapsed since last relevant call)"
+    )
+    _MODES: ClassVar[tuple[str, str]] = ("calling", "streaming")
+
     def __init__(self, logger: logger._AkariLogger, options: _AkariRouterLoggerOptions | None = None) -> None:
         """Constructs an AkariRouter instance.
 
@@ -49,18 +150,29 @@ class _AkariRouter:
         """
         if options is None:
             options = _AkariRouterLoggerOptions()
-        self._modules: Dict[module._AkariModuleType, module._AkariModule] = {}
+        # モジュールの call / stream_call の束縛メソッドと、ログ出力用のクラス名を登録時に保持する
+        self._modules: Dict[module._AkariModuleType, tuple[_ModuleCall, _ModuleCall, str, bool]] = {}
+        self._sealed = False
         self._logger = logger
         self._options = options
-        # スレッドIDごとの最後のストリーム呼び出し完了時刻 (perf_counter) を格納
-        self._thread_last_perf_counter: Dict[int, float] = {}
+        # オプションは不変なので、ログ出力の可能性があるかどうかを事前に決めておく
+        self._logging = options.info or options.duration
+        # duration のログには計測結果が必要なため、その場合は常に記録する
+        self._record = options.record_timings or options.duration
+        # スレッドごとの最後のストリーム呼び出し完了時刻 (perf_counter_ns) を格納
+        # threading.local を使うため、スレッド終了時に自動的に破棄される
+        self._tls = threading.local()
 
     def addModules(self, modules: Dict[module._AkariModuleType, module._AkariModule]) -> None:
         """Registers one or more modules with the router, making them available for execution.
 
-        Each module is added to an internal registry, keyed by its type.
-        Attempting to add a module type that already exists in the registry
-        will result in an error.
+        Each module is added to an internal registry, keyed by its type. The
+        registry holds the module's bound `call` and `stream_call` methods, so
+        dispatch needs no attribute lookups, together with its class name for
+        use in log messages and its `requires_isolation` flag.
+        Attempting to add a module type that already exists in the registry,
+        or adding modules after the router has been sealed, will result in an
+        error; in that case none of the given modules are registered.
 
         Args:
             modules (Dict[_AkariModuleType, _AkariModule]): A dictionary where keys
@@ -68,14 +180,83 @@ class _AkariRouter:
                 are instances of those modules.
 
         Raises:
-            ValueError: If a module type included in the `modules` dictionary
-                has already been registered with the router.
+            ValueError: If the router has been sealed, or if a module type included
+                in the `modules` dictionary has already been registered with the router.
         """
-        for moduleType, moduleInstance in modules.items():
-            if moduleType not in self._modules:
-                self._modules[moduleType] = moduleInstance
-            else:
-                raise ValueError(f"Module {moduleType} already exists in router.")
+        if self._sealed:
+            raise ValueError("Router is sealed; no more modules can be added.")
+        duplicates = self._modules.keys() & modules.keys()
+        if duplicates:
+            raise ValueError(f"Module {', '.join(map(str, duplicates))} already exists in router.")
+        self._modules.update(
+            {
+                moduleType: (
+                    moduleInstance.call,
+                    moduleInstance.stream_call,
+                    type(moduleInstance).__name__,
+                    moduleInstance.requires_isolation,
+                )
+                for moduleType, moduleInstance in modules.items()
+            }
+        )
+
+    @contextlib.contextmanager
+    def streamScope(
+        self,
+        moduleType: module._AkariModuleType,
+        params: module._AkariModuleParams,
+        callback: module._AkariModuleType | None = None,
+    ) -> Iterator[_AkariStreamScope]:
+        """Opens a scope for streaming many chunks through one module with per-stream rather than per-chunk bookkeeping.
+
+        Unlike calling `callModule` with `streaming=True` for every chunk, the
+        scope records the start time once on entry and, on exit, attaches a
+        single `_AkariDataModuleType` spanning the whole stream to the last
+        dataset produced (unless that dataset already carries metadata). This
+        also happens when the stream ends with an exception, so the chunks
+        processed before the failure keep their timing. No
+        router logging is performed for individual chunks. `callModule` remains
+        available for per-chunk metadata.
+
+        Args:
+            moduleType (module._AkariModuleType): The class type of the Akari module to stream through.
+            params (module._AkariModuleParams): The parameters passed with every chunk.
+            callback (Optional[module._AkariModuleType]): The callback module passed
+                with every chunk.
+
+        Yields:
+            _AkariStreamScope: The scope whose `call` method processes one chunk.
+
+        Raises:
+            ValueError: If the requested `moduleType` is not found in the registry.
+        """
+        try:
+            _, stream_fn, _, _ = self._modules[moduleType]
+        except KeyError:
+            raise ValueError(f"Module {moduleType} not found in router.") from None
+
+        scope = _AkariStreamScope(stream_fn, params, callback)
+        startTime = _perf()
+        try:
+            yield scope
+        finally:
+            # 途中で例外が発生した場合も、それまでに処理したチャンクの計測結果を残す
+            endTime = _perf()
+            last = scope.last
+            if self._record and last is not None and len(last) and last.last().module is None:
+                last.last().module = akari_data._AkariDataModuleType(
+                    moduleType, params, True, callback, startTime, endTime
+                )
+
+    def seal(self) -> None:
+        """Freezes the module registry so that no further modules can be added.
+
+        Intended to be called once all modules have been registered at startup,
+        so that the set of modules cannot change while the pipeline is running.
+        Lookups in `callModule` are unaffected. Sealing an already sealed router
+        has no effect.
+        """
+        self._sealed = True
 
     def callModule(
         self,
@@ -84,144 +265,214 @@ class _AkariRouter:
         params: module._AkariModuleParams,
         streaming: bool,
         callback: module._AkariModuleType | None = None,
+        *,
+        _perf: Callable[[], int] = _perf,
+        _get_ident: Callable[[], int] = threading.get_ident,
+        _dataset_t: type[akari_data._AkariDataSet] = _DATASET_T,
+        _data_t: type[akari_data._AkariData] = _DATA_T,
+        _module_meta: type[akari_data._AkariDataModuleType] = akari_data._AkariDataModuleType,
     ) -> akari_data._AkariData:
         """Executes a specified Akari module.
 
         Handles data flow, parameter passing, and optional streaming callbacks.
         It also records metadata about the module's execution, such as start
         and end times, and attaches this metadata to the resulting dataset.
-        A deep copy of the input `data` is made before passing it to the
-        selected module to ensure data isolation if needed.
+        The selected module receives a copy of `data` (see `_AkariData.clone`),
+        so it may add datasets to its input or modify the datasets in it without
+        affecting the caller's sequence. A module class that never modifies its
+        input can set `requires_isolation` to False to receive the caller's
+        `data` itself instead; a truthy `isolate` attribute on `params` restores
+        the copy for a single call. Either way, the module's resulting dataset
+        is added to the caller's `data`.
 
         Args:
             moduleType (module._AkariModuleType): The class type of the Akari module to execute.
             data (akari_data._AkariData): The input data object for the module.
             params (module._AkariModuleParams): The parameters to be passed to the module.
+                If it has a truthy `isolate` attribute, the module receives a copy of
+                `data` even if its class sets `requires_isolation` to False.
             streaming (bool): A flag indicating whether the module should be called
-                in streaming mode. If True, `selected_module.stream_call` is used;
-                otherwise, `selected_module.call` is used.
+                in streaming mode. If True, the module's `stream_call` is used;
+                otherwise, its `call` is used.
             callback (Optional[module._AkariModuleType]): An optional module type to be
                 used as a callback by the executed module, particularly relevant
                 for streaming operations.
+            _perf (Callable[[], int]): Internal; binds the clock as a local. Not to be passed by callers.
+            _get_ident (Callable[[], int]): Internal; binds `threading.get_ident` as a local.
+                Not to be passed by callers.
+            _dataset_t (type[akari_data._AkariDataSet]): Internal; binds the dataset class as a local.
+                Not to be passed by callers.
+            _data_t (type[akari_data._AkariData]): Internal; binds the data class as a local.
+                Not to be passed by callers.
+            _module_meta (type[akari_data._AkariDataModuleType]): Internal; binds the module
+                metadata class as a local. Not to be passed by callers.
 
         Returns:
             akari_data._AkariData: The `data` object, potentially modified or augmented
             with new datasets produced by the executed module.
 
         Raises:
-            ValueError: If the router's module registry has not been initialized,
-                if the requested `moduleType` is not found in the registry, or if
-                the executed module returns a result of an unexpected type.
+            ValueError: If the requested `moduleType` is not found in the registry,
+                or if the executed module returns a result of an unexpected type.
         """
-        if self._modules is None:
-            raise ValueError("Modules not set in router.")
-
-        selected_module = self._modules.get(moduleType)
-        if selected_module is None:
-            raise ValueError(f"Module {moduleType} not found in router.")
-
-        current_thread_id = threading.get_ident()
-        pid = os.getpid()
-
-        if self._options.info:
+        try:
+            call_fn, stream_fn, cls_name, requires_isolation = self._modules[moduleType]
+        except KeyError:
+            raise ValueError(f"Module {moduleType} not found in router.") from None
+
+        # ログ出力が無効な場合は引数の組み立て自体を省略する
+        # duration が有効な場合は終了時の1行にまとめ、開始時のログは出さない
+        log_info = log_duration = False
+        if self._logging and self._logger.isEnabledFor(logging.INFO):
+            log_duration = self._options.duration
+            log_info = self._options.info and not log_duration
+        if log_info or log_duration:
+            mode_str = self._MODES[streaming]
+            current_thread_id = _get_ident()
+
+        if log_info:
             self._logger.info(
-                "\n\n[Router] Module %s (PID: %s, ThreadID: %s): %s",
-                "streaming" if streaming else "calling",
-                pid,
+                self._INFO_FMT,
+                mode_str,
+                _PID,
                 current_thread_id,
-                selected_module.__class__.__name__,
+                cls_name,
+                extra={"akari_mode": mode_str, "akari_module": cls_name},
             )
 
         # --- AkariDataModuleType に記録する startTime と endTime のための準備 ---
-        # perf_counter を使用して実時間を計測
-        current_perf_counter = time.perf_counter()
+        # record_timings が無効な場合は計測とメタデータの記録をすべて省略する
+        record = self._record
 
-        # AkariDataModuleType に記録する startTime
-        # これが「計測期間の開始点」となる
-        startTime_for_dataset: float
+        # AkariDataModuleType に記録する startTime と endTime
+        # startTime が「計測期間の開始点」となる
+        startTime_for_dataset = endTime_for_dataset = 0
 
         # このスレッドでの前回のストリーム呼び出しの終了時刻 (ストリーミングの場合のみ参照)
-        last_stream_call_end_time_in_thread = self._thread_last_perf_counter.get(current_thread_id)
-
-        if streaming:
-            if last_stream_call_end_time_in_thread is None:  # このスレッドでの初回ストリーム呼び出し
-                # 経過時間0の要件を満たすため、startTime はこの後の endTime と同じ値にする。
-                # この時点では endTime は未定なので、モジュール実行後に endTime で startTime を上書きする。
-                # 仮の startTime として、現在の時刻を設定しておく。
-                startTime_for_dataset = current_perf_counter
-            else:
-                # 2回目以降のストリーム呼び出し: 前回の終了時刻を開始時刻とする
-                startTime_for_dataset = last_stream_call_end_time_in_thread
-        else:  # 非ストリーミング
-            if data.datasets and data.last().module is not None:
-                # 前のモジュールの終了時刻を開始時刻とする
-                last_module = cast(akari_data._AkariDataModuleType, data.last().module)
-                startTime_for_dataset = last_module.endTime
-            else:
-                # 前のモジュールがない場合は、現在の呼び出し処理開始時刻
-                startTime_for_dataset = current_perf_counter
+        last_stream_call_end_time_in_thread: int | None = None
+
+        if record:
+            if streaming:
+                last_stream_call_end_time_in_thread = getattr(self._tls, "last_perf_counter", None)
+                if last_stream_call_end_time_in_thread is None:  # このスレッドでの初回ストリーム呼び出し
+                    # 経過時間0の要件を満たすため、startTime はこの後の endTime と同じ値にする。
+                    # この時点では endTime は未定なので、モジュール実行後に endTime で startTime を上書きする。
+                    # 仮の startTime として、現在の時刻を設定しておく。
+                    startTime_for_dataset = _perf()
+                else:
+                    # 2回目以降のストリーム呼び出し: 前回の終了時刻を開始時刻とする
+                    startTime_for_dataset = last_stream_call_end_time_in_thread
+            else:  # 非ストリーミング
+                last_module = data.last().module if len(data) else None
+                if last_module is not None:
+                    # 前のモジュールの終了時刻を開始時刻とする
+                    startTime_for_dataset = last_module.endTime
+                else:
+                    # 前のモジュールがない場合は、現在の呼び出し処理開始時刻 (perf_counter_ns)
+                    startTime_for_dataset = _perf()
 
         # --- モジュールの実処理呼び出し ---
-        # モジュールに渡す inputData の準備 (deepcopy)
-        inputData = copy.deepcopy(data)
-
-        if streaming:
-            result = selected_module.stream_call(inputData, params, callback)
-        else:
-            result = selected_module.call(inputData, params, callback)
+        # モジュールに渡す inputData の準備
+        # 既定ではコピーを渡し、入力を変更しないと宣言した (requires_isolation = False) モジュールにのみ
+        # 呼び出し元の data をそのまま渡す
+        inputData = data.clone() if requires_isolation or getattr(params, "isolate", False) else data
 
-        # AkariDataModuleType に記録する endTime
-        # モジュール実行完了後の時刻
-        endTime_for_dataset: float = time.perf_counter()
+        result = (stream_fn if streaming else call_fn)(inputData, params, callback)
 
-        # ストリーミング初回呼び出しの場合、startTime を endTime と同じにして duration を0にする
-        if streaming and last_stream_call_end_time_in_thread is None:
-            startTime_for_dataset = endTime_for_dataset
+        if record:
+            # モジュール実行完了後の時刻
+            endTime_for_dataset = _perf()
 
-        # ストリーミングの場合、このスレッドでの今回の呼び出しの終了時刻を保存
-        if streaming:
-            self._thread_last_perf_counter[current_thread_id] = endTime_for_dataset
+            if streaming:
+                # ストリーミング初回呼び出しの場合、startTime を endTime と同じにして duration を0にする
+                if last_stream_call_end_time_in_thread is None:
+                    startTime_for_dataset = endTime_for_dataset
+                # このスレッドでの今回の呼び出しの終了時刻を保存
+                self._tls.last_perf_counter = endTime_for_dataset
 
         # --- 結果の処理と AkariDataModuleType の設定 ---
-        if isinstance(result, akari_data._AkariDataSet):
-            if result.module is None:
-                result.setModule(
-                    akari_data._AkariDataModuleType(
-                        moduleType,
-                        params,
-                        streaming,
-                        callback,
-                        startTime_for_dataset,  # 修正後のstartTime
-                        endTime_for_dataset,  # 修正後のendTime
-                    )
+        # 通常は型の同一性のみで判定し、サブクラスの場合に限り isinstance にフォールバックする
+        result_type: type = type(result)
+        if result_type is not _dataset_t and result_type is not _data_t:
+            if isinstance(result, _dataset_t):
+                result_type = _dataset_t
+            elif isinstance(result, _data_t):
+                result_type = _data_t
+            else:
+                raise ValueError(f"Invalid result type: {type(result)}")
+
+        if result_type is _dataset_t:
+            result = cast(akari_data._AkariDataSet, result)
+            if record and result.module is None:
+                result.module = _module_meta(
+                    moduleType,
+                    params,
+                    streaming,
+                    callback,
+                    startTime_for_dataset,  # 修正後のstartTime
+                    endTime_for_dataset,  # 修正後のendTime
                 )
             data.add(result)
-        elif isinstance(result, akari_data._AkariData):
-            if result.datasets:  # result が空の AkariData を返す可能性も考慮
-                result.last().setModule(
-                    akari_data._AkariDataModuleType(
-                        moduleType,
-                        params,
-                        streaming,
-                        callback,
-                        startTime_for_dataset,  # 修正後のstartTime
-                        endTime_for_dataset,  # 修正後のendTime
-                    )
-                )
-            data = result
+            out = data
         else:
-            raise ValueError(f"Invalid result type: {type(result)}")
+            result = cast(akari_data._AkariData, result)
+            if record and len(result):  # result が空の AkariData を返す可能性も考慮
+                result.last().module = _module_meta(
+                    moduleType,
+                    params,
+                    streaming,
+                    callback,
+                    startTime_for_dataset,  # 修正後のstartTime
+                    endTime_for_dataset,  # 修正後のendTime
+                )
+            out = result
 
-        if self._options.duration:
+        if log_duration:
             # ここでログ出力する duration は、AkariDataModuleType に記録された endTime - startTime
-            module = data.last().module
-            duration = module.endTime - module.startTime if module else endTime_for_dataset - startTime_for_dataset
+            last_mod = out.last().module if len(out) else None
+            duration_ns = (
+                last_mod.endTime - last_mod.startTime if last_mod else endTime_for_dataset - startTime_for_dataset
+            )
+            duration_ms = duration_ns / 1e6
+            # 構造化ハンドラ向けに同じ値を extra にも載せる (LogRecord の属性名と衝突しないよう接頭辞を付ける)
             self._logger.info(
-                "[Router] Module %s: %s (ThreadID: %s) took %.4f seconds (elapsed since last relevant call)",
-                "streaming" if streaming else "calling",
-                selected_module.__class__.__name__,
+                self._DURATION_FMT,
+                mode_str,
+                cls_name,
+                _PID,
                 current_thread_id,
-                duration,
+                duration_ms,
+                extra={"akari_mode": mode_str, "akari_module": cls_name, "akari_duration_ms": duration_ms},
             )
 
-        return data
+        return out
+
+    async def callModuleAsync(
+        self,
+        moduleType: module._AkariModuleType,
+        data: akari_data._AkariData,
+        params: module._AkariModuleParams,
+        streaming: bool,
+        callback: module._AkariModuleType | None = None,
+    ) -> akari_data._AkariData:
+        """Executes a specified Akari module without blocking the running event loop.
+
+        The module is run by `callModule` in a worker thread via `asyncio.to_thread`,
+        so network-bound or playback-bound modules can overlap with other tasks on
+        the loop. Modules themselves stay synchronous.
+
+        Args:
+            moduleType (module._AkariModuleType): The class type of the Akari module to execute.
+            data (akari_data._AkariData): The input data object for the module.
+            params (module._AkariModuleParams): The parameters to be passed to the module.
+            streaming (bool): Whether to call the module's `stream_call` instead of `call`.
+            callback (Optional[module._AkariModuleType]): An optional module type to be
+                used as a callback by the executed module.
+
+        Returns:
+            akari_data._AkariData: The result of `callModule`.
+
+        Raises:
+            ValueError: Under the same conditions as `callModule`.
+        """
+        return await asyncio.to_thread(self.callModule, moduleType, data, params, streaming, callback)
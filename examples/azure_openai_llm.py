@@ -0,0 +1,30 @@
+import akari
+import modules
+from modules import azure_openai
+
+
+def run(router: akari.AkariRouter) -> None:
+    """Streams an Azure OpenAI chat completion to the print module.
+
+    Args:
+        router (akari.AkariRouter): A router with the Azure OpenAI and print modules registered.
+    """
+    router.callModule(
+        moduleType=azure_openai.LLMModule,
+        data=akari.AkariData(),
+        params=azure_openai.LLMModuleParams(
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "user", "content": "Hello, Akari!"},
+                {"role": "system", "content": "You are a helpful assistant."},
+            ],
+            temperature=0.7,
+            max_tokens=150,
+            top_p=1.0,
+            frequency_penalty=0.0,
+            presence_penalty=0.0,
+            stream=True,
+        ),
+        streaming=False,
+        callback=modules.PrintModule,
+    )
@@ -0,0 +1,37 @@
+import akari
+import modules
+from modules import audio, azure_openai
+
+
+def run(router: akari.AkariRouter) -> None:
+    """Prints a greeting, then speaks it with Azure OpenAI text-to-speech.
+
+    Args:
+        router (akari.AkariRouter): A router with the serial, print, Azure OpenAI and speaker modules registered.
+    """
+    data = akari.AkariData()
+    dataset = akari.AkariDataSet()
+    dataset.text = akari.AkariDataSetType(main="Hello, Akari!")
+    data.add(dataset)
+    router.callModule(
+        moduleType=modules.SerialModule,
+        data=data,
+        params=modules.SerialModuleParams(
+            modules=[
+                modules.SerialModuleParamModule(moduleType=modules.PrintModule, moduleParams=None),
+                modules.SerialModuleParamModule(
+                    moduleType=azure_openai.TTSModule,
+                    moduleParams=azure_openai.TTSModuleParams(
+                        model="gpt-4o-mini-tts",
+                        voice="alloy",
+                        instructions="日本語で元気溌剌に話してください",
+                        speed=1.0,
+                    ),
+                ),
+                modules.SerialModuleParamModule(
+                    moduleType=audio.SpeakerModule, moduleParams=audio.SpeakerModuleParams()
+                ),
+            ]
+        ),
+        streaming=False,
+    )
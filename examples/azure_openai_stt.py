@@ -0,0 +1,26 @@
+import akari
+from modules import azure_openai
+
+
+def run(router: akari.AkariRouter) -> None:
+    """Transcribes `input.wav` with Azure OpenAI.
+
+    Args:
+        router (akari.AkariRouter): A router with the Azure OpenAI modules registered.
+    """
+    data = akari.AkariData()
+    dataset = akari.AkariDataSet()
+    with open("input.wav", "rb") as audio_file:
+        dataset.audio = akari.AkariDataSetType(main=audio_file.read())
+    data.add(dataset)
+    router.callModule(
+        moduleType=azure_openai.STTModule,
+        data=data,
+        params=azure_openai.STTModuleParams(
+            model="whisper",
+            language="ja",
+            prompt="",
+            temperature=0.7,
+        ),
+        streaming=False,
+    )
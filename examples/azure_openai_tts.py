@@ -0,0 +1,29 @@
+import pathlib
+
+import akari
+from modules import azure_openai
+
+
+def run(router: akari.AkariRouter) -> None:
+    """Synthesizes speech with Azure OpenAI and writes it to `output.wav`.
+
+    Args:
+        router (akari.AkariRouter): A router with the Azure OpenAI modules registered.
+    """
+    data = akari.AkariData()
+    dataset = akari.AkariDataSet()
+    dataset.text = akari.AkariDataSetType(main="あかりだよ、よろしくね！")
+    data.add(dataset)
+    router.callModule(
+        moduleType=azure_openai.TTSModule,
+        data=data,
+        params=azure_openai.TTSModuleParams(
+            model="gpt-4o-mini-tts",
+            voice="alloy",
+            instructions="日本語で元気溌剌に話してください",
+            response_format="wav",
+            speed=1.0,
+            output_path=pathlib.Path("output.wav"),
+        ),
+        streaming=False,
+    )
@@ -0,0 +1,62 @@
+import asyncio
+
+from vertexai.generative_models import Content, Part
+
+import akari
+import modules
+from modules import azure_openai, gemini
+
+
+def _text(text: str) -> akari.AkariData:
+    data = akari.AkariData()
+    dataset = akari.AkariDataSet()
+    dataset.text = akari.AkariDataSetType(main=text)
+    data.add(dataset)
+    return data
+
+
+async def _run(router: akari.AkariRouter) -> tuple[akari.AkariData, akari.AkariData, akari.AkariData]:
+    return await asyncio.gather(
+        router.callModuleAsync(
+            moduleType=gemini.LLMModule,
+            data=akari.AkariData(),
+            params=gemini.LLMModuleParams(
+                model="gemini-2.0-flash",
+                messages=[Content(role="user", parts=[Part.from_text("Hello, Akari!")])],
+            ),
+            streaming=False,
+        ),
+        router.callModuleAsync(
+            moduleType=azure_openai.LLMModule,
+            data=akari.AkariData(),
+            params=azure_openai.LLMModuleParams(
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": "Hello, Akari!"}],
+            ),
+            streaming=False,
+        ),
+        router.callModuleAsync(
+            moduleType=azure_openai.TTSModule,
+            data=_text("あかりだよ、よろしくね！"),
+            params=azure_openai.TTSModuleParams(
+                model="gpt-4o-mini-tts",
+                voice="alloy",
+                instructions="日本語で元気溌剌に話してください",
+            ),
+            streaming=False,
+        ),
+    )
+
+
+def run(router: akari.AkariRouter) -> None:
+    """Runs independent Gemini, Azure OpenAI LLM and TTS requests concurrently.
+
+    The requests do not depend on each other, so they are issued together with
+    `asyncio.gather` over `callModuleAsync` and the total time is that of the
+    slowest request rather than the sum.
+
+    Args:
+        router (akari.AkariRouter): A router with the Gemini, Azure OpenAI and print modules registered.
+    """
+    for data in asyncio.run(_run(router)):
+        router.callModule(moduleType=modules.PrintModule, data=data, params=None, streaming=False)
@@ -0,0 +1,71 @@
+from typing import Iterable
+
+from openai.types.chat import ChatCompletionMessageParam
+
+import akari
+import modules
+from modules import audio, azure_openai
+
+
+def _messages(data: akari.AkariData) -> Iterable[ChatCompletionMessageParam]:
+    text = data.last().text
+    return [
+        {"role": "user", "content": text.main if text else "Hello, Akari!"},
+        {"role": "system", "content": "You are a helpful assistant."},
+    ]
+
+
+def run(router: akari.AkariRouter) -> None:
+    """Runs a voice conversation: microphone, speech-to-text, LLM, text-to-speech and speaker.
+
+    Args:
+        router (akari.AkariRouter): A router with the audio, serial and Azure OpenAI modules registered.
+    """
+    router.callModule(
+        moduleType=audio.MicModule,
+        data=akari.AkariData(),
+        params=audio.MicModuleParams(
+            streamDurationMilliseconds=100,
+            destructionMilliseconds=5000,
+            # input_device_index=3,
+            callbackParams=modules.SerialModuleParams(
+                modules=[
+                    modules.SerialModuleParamModule(
+                        moduleType=azure_openai.STTModule,
+                        moduleParams=azure_openai.STTModuleParams(
+                            model="whisper",
+                            language="ja",
+                            prompt="",
+                            temperature=0.7,
+                        ),
+                    ),
+                    modules.SerialModuleParamModule(
+                        moduleType=azure_openai.LLMModule,
+                        moduleParams=azure_openai.LLMModuleParams(
+                            model="gpt-4o-mini",
+                            messages_function=_messages,
+                            temperature=0.7,
+                        ),
+                    ),
+                    modules.SerialModuleParamModule(
+                        moduleType=azure_openai.TTSModule,
+                        moduleParams=azure_openai.TTSModuleParams(
+                            model="gpt-4o-mini-tts",
+                            voice="alloy",
+                            instructions="日本語で元気溌剌に話してください",
+                            speed=1.0,
+                        ),
+                    ),
+                    modules.SerialModuleParamModule(
+                        moduleType=audio.SpeakerModule,
+                        moduleParams=audio.SpeakerModuleParams(
+                            # output_device_index=1,
+                        ),
+                    ),
+                ]
+            ),
+            callback_callback=modules.SerialModule,
+        ),
+        streaming=False,
+        callback=modules.SerialModule,
+    )
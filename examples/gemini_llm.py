@@ -0,0 +1,23 @@
+from vertexai.generative_models import Content, Part
+
+import akari
+from modules import gemini
+
+
+def run(router: akari.AkariRouter) -> None:
+    """Generates a Gemini response.
+
+    Args:
+        router (akari.AkariRouter): A router with the Gemini module registered.
+    """
+    router.callModule(
+        moduleType=gemini.LLMModule,
+        data=akari.AkariData(),
+        params=gemini.LLMModuleParams(
+            model="gemini-2.0-flash",
+            messages=[
+                Content(role="user", parts=[Part.from_text("Hello, Akari!")]),
+            ],
+        ),
+        streaming=False,
+    )
@@ -0,0 +1,39 @@
+import asyncio
+
+import akari
+import modules
+from modules import audio, google
+
+
+def run(router: akari.AkariRouter) -> None:
+    """Prints a greeting, then speaks it with Google text-to-speech, streaming the audio to the speaker.
+
+    Args:
+        router (akari.AkariRouter): A router with the serial, print, Google TTS and speaker modules registered.
+    """
+    data = akari.AkariData()
+    dataset = akari.AkariDataSet()
+    dataset.text = akari.AkariDataSetType(main="Hello, Akari!")
+    data.add(dataset)
+    asyncio.run(
+        router.callModuleAsync(
+            moduleType=modules.SerialModule,
+            data=data,
+            params=modules.SerialModuleParams(
+                modules=[
+                    modules.SerialModuleParamModule(moduleType=modules.PrintModule, moduleParams=None),
+                    modules.SerialModuleParamModule(
+                        moduleType=google.GoogleTextToSpeechModule,
+                        moduleParams=google.GoogleTextToSpeechParams(
+                            voice_name="ja-JP-Chirp3-HD-Kore",
+                            callback_params=audio.SpeakerModuleParams(
+                                # output_device_index=6,
+                            ),
+                        ),
+                        moduleCallback=audio.SpeakerModule,
+                    ),
+                ]
+            ),
+            streaming=False,
+        )
+    )
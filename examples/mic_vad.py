@@ -0,0 +1,23 @@
+import akari
+import modules
+from modules import audio, webrtcvad
+
+
+def run(router: akari.AkariRouter) -> None:
+    """Records from the microphone and prints the segments WebRTC VAD detects as speech.
+
+    Args:
+        router (akari.AkariRouter): A router with the microphone, VAD and print modules registered.
+    """
+    router.callModule(
+        moduleType=audio.MicModule,
+        data=akari.AkariData(),
+        params=audio.MicModuleParams(
+            streamDurationMilliseconds=1000,
+            destructionMilliseconds=5000,
+            callbackParams=webrtcvad.WebRTCVadParams(),
+            callback_callback=modules.PrintModule,
+        ),
+        streaming=False,
+        callback=webrtcvad.WebRTCVadModule,
+    )
@@ -0,0 +1,17 @@
+import akari
+import modules
+import sample
+
+
+def run(router: akari.AkariRouter) -> None:
+    """Calls the sample module through the root module.
+
+    Args:
+        router (akari.AkariRouter): A router with the root and sample modules registered.
+    """
+    router.callModule(
+        moduleType=modules.RootModule,
+        data=akari.AkariData(),
+        params=sample.SampleModule,
+        streaming=False,
+    )
@@ -0,0 +1,21 @@
+import akari
+from modules import audio
+
+
+def run(router: akari.AkariRouter) -> None:
+    """Plays `input.wav` through the speaker module.
+
+    Args:
+        router (akari.AkariRouter): A router with the speaker module registered.
+    """
+    data = akari.AkariData()
+    dataset = akari.AkariDataSet()
+    with open("input.wav", "rb") as audio_file:
+        dataset.audio = akari.AkariDataSetType(main=audio_file.read())
+    data.add(dataset)
+    router.callModule(
+        moduleType=audio.SpeakerModule,
+        data=data,
+        params=audio.SpeakerModuleParams(),
+        streaming=False,
+    )
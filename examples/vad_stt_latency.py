@@ -0,0 +1,36 @@
+import akari
+import modules
+from modules import audio, google, performance, webrtcvad
+
+
+def run(router: akari.AkariRouter) -> None:
+    """Measures the latency between WebRTC VAD and Google speech-to-text on microphone input.
+
+    Args:
+        router (akari.AkariRouter): A router with the audio, VAD, Google STT and latency meter modules registered.
+    """
+    router.callModule(
+        moduleType=audio.MicModule,
+        data=akari.AkariData(),
+        params=audio.MicModuleParams(
+            streamDurationMilliseconds=100,
+            destructionMilliseconds=5000,
+            callbackParams=performance.VADSTTLatencyMeterConfig(
+                stt_module=google.GoogleSpeechToTextStreamModule,
+                stt_module_params=google.GoogleSpeechToTextStreamParams(),
+                vad_module=webrtcvad.WebRTCVadModule,
+                vad_module_params=webrtcvad.WebRTCVadParams(),
+                callback_params=modules.SerialModuleParams(
+                    modules=[
+                        modules.SerialModuleParamModule(
+                            moduleType=modules.PrintModule,
+                            moduleParams=None,
+                        ),
+                    ]
+                ),
+            ),
+            callback_callback=modules.SerialModule,
+        ),
+        streaming=False,
+        callback=performance.VADSTTLatencyMeter,
+    )
@@ -1,362 +1,332 @@
+import argparse
+import concurrent.futures
+import functools
+import importlib
 import logging
 import os
+import threading
+from typing import TYPE_CHECKING, Any, Callable
 
 import dotenv
-import pyaudio
-import vertexai
-from azure.identity import DefaultAzureCredential, get_bearer_token_provider
-from google.cloud import speech, texttospeech
-from google.oauth2 import service_account
-from openai import AzureOpenAI
-from vertexai.generative_models import Content, Part
 
 import akari
 import modules
 import sample
-from modules import audio, azure_openai, gemini, google, io, performance, webrtcvad
+from modules import audio, io, performance, webrtcvad
 
-dotenv.load_dotenv()
+if TYPE_CHECKING:
+    from openai import AzureOpenAI
 
 
-akariLogger = akari.getLogger(
-    "Akari",
-    logging.INFO,
-)
+def require_env(name: str) -> str:
+    """Return the value of a required environment variable.
 
-akariLogger.info("Hello, Akari!")
+    Args:
+        name (str): The name of the environment variable.
 
+    Returns:
+        str: The non-empty value of the variable.
 
-def list_audio_devices() -> None:
-    """Enumerates and logs details of all audio devices discoverable by PyAudio.
+    Raises:
+        RuntimeError: If the variable is unset or empty.
+    """
+    value = os.environ.get(name)
+    if not value:
+        raise RuntimeError(f"Environment variable {name} is not set.")
+    return value
+
+
+def enabled_providers(default: frozenset[str]) -> frozenset[str]:
+    """Return the providers whose clients and modules should be built.
+
+    The `AKARI_PROVIDERS` environment variable, a comma-separated list of
+    `azure_openai`, `google_stt`, `google_tts` and `gemini`, overrides `default`.
+
+    Args:
+        default (frozenset[str]): The providers the selected command needs.
+
+    Returns:
+        frozenset[str]: The names of the enabled providers.
+    """
+    # 各プロバイダの SDK は gRPC / protobuf / TLS の初期化を伴い重いため、有効なものだけを遅延インポートする
+    value = os.getenv("AKARI_PROVIDERS")
+    if not value:
+        return default
+    return frozenset(provider.strip() for provider in value.split(",") if provider.strip())
+
+
+def build_google_credentials() -> Any:
+    """Load the Google service account credentials shared by the Google and Gemini modules.
+
+    Returns:
+        Any: The service account credentials.
+    """
+    from google.oauth2 import service_account
+
+    return service_account.Credentials.from_service_account_file(
+        require_env("GOOGLE_APPLICATION_CREDENTIALS"),
+    )
+
+
+def prewarm_grpc_channel(client: Any) -> None:
+    """Start connecting a Google Cloud client's gRPC channel in the background.
+
+    The channel is otherwise connected lazily, so the first request would pay
+    for the TCP, TLS and HTTP/2 handshakes. This does not block.
+
+    Args:
+        client (Any): A Google Cloud client using the gRPC transport.
+    """
+    import grpc
+
+    channel = getattr(client.transport, "grpc_channel", None)
+    if channel is not None:
+        grpc.channel_ready_future(channel)
+
+
+@functools.lru_cache(maxsize=1)
+def get_azure_openai_client() -> "AzureOpenAI":
+    """Return the process-wide Azure OpenAI client, creating it on first use.
+
+    Every caller shares the same client and therefore the same HTTP connection
+    pool and bearer token provider. Idle connections are kept for five minutes
+    instead of httpx's default five seconds, so calls separated by pauses (e.g.
+    one per utterance in a microphone loop) reuse the TLS connection.
+
+    Returns:
+        AzureOpenAI: The Azure OpenAI client.
+    """
+    import httpx
+    from azure.identity import DefaultAzureCredential, get_bearer_token_provider
+    from openai import AzureOpenAI, DefaultHttpxClient
+
+    endpoint = require_env("AZURE_OPENAI_ENDPOINT")
+    token_provider = get_bearer_token_provider(
+        DefaultAzureCredential(exclude_managed_identity_credential=True), "https://cognitiveservices.azure.com/.default"
+    )
+    # get_bearer_token_provider はトークンを有効期限まで保持するため、ここで一度取得しておけば
+    # 資格情報チェーンの探索を最初のリクエストではなく (並行実行される) 起動時に済ませられる
+    token_provider()
+    return AzureOpenAI(
+        api_version="2024-10-01-preview",
+        azure_endpoint=endpoint,
+        azure_ad_token_provider=token_provider,
+        http_client=DefaultHttpxClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=32, keepalive_expiry=300),
+        ),
+    )
+
+
+def build_azure_openai_modules(
+    router: akari.AkariRouter, logger: akari.AkariLogger
+) -> dict[akari.AkariModuleType, akari.AkariModule]:
+    """Build the Azure OpenAI modules around the shared client.
+
+    Args:
+        router (akari.AkariRouter): The router the modules are registered to.
+        logger (akari.AkariLogger): The logger passed to the modules.
+
+    Returns:
+        dict[akari.AkariModuleType, akari.AkariModule]: The Azure OpenAI modules.
+    """
+    from modules import azure_openai
+
+    client = get_azure_openai_client()
+    return {
+        azure_openai.LLMModule: azure_openai.LLMModule(router, logger, client),
+        azure_openai.STTModule: azure_openai.STTModule(router, logger, client),
+        azure_openai.TTSModule: azure_openai.TTSModule(router, logger, client),
+    }
+
+
+def build_google_stt_modules(
+    router: akari.AkariRouter, logger: akari.AkariLogger, credentials: Any
+) -> dict[akari.AkariModuleType, akari.AkariModule]:
+    """Build the Google Speech-to-Text client and module.
+
+    Args:
+        router (akari.AkariRouter): The router the modules are registered to.
+        logger (akari.AkariLogger): The logger passed to the modules.
+        credentials (Any): The Google service account credentials.
 
-    Initializes the PyAudio library to query for available audio hardware.
-    For each detected device, it logs its unique index, human-readable name,
-    maximum number of input channels, and maximum number of output channels.
-    This information is logged at the DEBUG level using the globally configured
-    Akari logger. This utility is helpful for debugging audio configurations or
-    allowing users to select specific audio devices. The PyAudio instance is
-    properly terminated before the function exits.
+    Returns:
+        dict[akari.AkariModuleType, akari.AkariModule]: The Google Speech-to-Text module.
     """
-    p = pyaudio.PyAudio()
-    for i in range(p.get_device_count()):
-        info = p.get_device_info_by_index(i)
-        akariLogger.info(
-            f"Device {i}: {info['name']} (Input: {info['maxInputChannels']}, Output: {info['maxOutputChannels']})"
-        )
-    p.terminate()
-
-
-list_audio_devices()
-
-
-token_provider = get_bearer_token_provider(
-    DefaultAzureCredential(exclude_managed_identity_credential=True), "https://cognitiveservices.azure.com/.default"
-)
-
-client = AzureOpenAI(
-    api_version="2024-10-01-preview",
-    azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT") or "",
-    azure_ad_token_provider=token_provider,
-)
-
-credentials = service_account.Credentials.from_service_account_file(
-    os.getenv("GOOGLE_APPLICATION_CREDENTIALS") or "",
-)  # type: ignore
-vertexai.init(
-    location=os.getenv("GOOGLE_LOCATION") or "us-central1",
-    credentials=credentials,
-)
-
-speech_client = speech.SpeechClient(credentials=credentials)
-tts_client = texttospeech.TextToSpeechClient(credentials=credentials)
-
-akariRouter = akari.AkariRouter(
-    logger=akariLogger,
-    options=akari.AkariRouterLoggerOptions(info=False, duration=True),
-)
-akariRouter.addModules(
-    {
-        modules.RootModule: modules.RootModule(akariRouter, akariLogger),
-        modules.PrintModule: modules.PrintModule(akariRouter, akariLogger),
-        modules.SerialModule: modules.SerialModule(akariRouter, akariLogger),
-        sample.SampleModule: sample.SampleModule(akariRouter, akariLogger),
-        azure_openai.LLMModule: azure_openai.LLMModule(akariRouter, akariLogger, client),
-        azure_openai.TTSModule: azure_openai.TTSModule(akariRouter, akariLogger, client),
-        google.GoogleSpeechToTextStreamModule: google.GoogleSpeechToTextStreamModule(
-            akariRouter, akariLogger, speech_client
+    from google.cloud import speech
+
+    from modules import google
+
+    speech_client = speech.SpeechClient(credentials=credentials)
+    prewarm_grpc_channel(speech_client)
+    return {
+        google.GoogleSpeechToTextStreamModule: google.GoogleSpeechToTextStreamModule(router, logger, speech_client),
+    }
+
+
+def build_google_tts_modules(
+    router: akari.AkariRouter, logger: akari.AkariLogger, credentials: Any
+) -> dict[akari.AkariModuleType, akari.AkariModule]:
+    """Build the Google Text-to-Speech client and module.
+
+    Synthesized audio is cached on disk only when the `AKARI_TTS_CACHE_DIR`
+    environment variable names a directory; the cache is not bounded, so
+    clear it as needed.
+
+    Args:
+        router (akari.AkariRouter): The router the modules are registered to.
+        logger (akari.AkariLogger): The logger passed to the modules.
+        credentials (Any): The Google service account credentials.
+
+    Returns:
+        dict[akari.AkariModuleType, akari.AkariModule]: The Google Text-to-Speech module.
+    """
+    from google.cloud import texttospeech
+
+    from modules import google
+
+    tts_client = texttospeech.TextToSpeechClient(credentials=credentials)
+    prewarm_grpc_channel(tts_client)
+    return {
+        google.GoogleTextToSpeechModule: google.GoogleTextToSpeechModule(
+            router, logger, tts_client, cache_dir=os.getenv("AKARI_TTS_CACHE_DIR") or None
         ),
-        google.GoogleTextToSpeechModule: google.GoogleTextToSpeechModule(akariRouter, akariLogger, tts_client),
-        gemini.LLMModule: gemini.LLMModule(akariRouter, akariLogger),
-        audio.SpeakerModule: audio.SpeakerModule(akariRouter, akariLogger),
-        audio.MicModule: audio.MicModule(akariRouter, akariLogger),
-        webrtcvad.WebRTCVadModule: webrtcvad.WebRTCVadModule(akariRouter, akariLogger),
-        io.SaveModule: io.SaveModule(akariRouter, akariLogger),
-        performance.VADSTTLatencyMeter: performance.VADSTTLatencyMeter(akariRouter, akariLogger),
     }
-)
-
-# akariRouter.callModule(
-#     moduleType=modules.RootModule,
-#     data=akari.AkariData(),
-#     params=sample.SampleModule,
-#     streaming=False,
-# )
-
-# akariRouter.callModule(
-#     moduleType=azure_openai.LLMModule,
-#     data=akari.AkariData(),
-#     params=azure_openai.LLMModuleParams(
-#         model="gpt-4o-mini",
-#         messages=[
-#             {"role": "user", "content": "Hello, Akari!"},
-#             {"role": "system", "content": "You are a helpful assistant."},
-#         ],
-#         temperature=0.7,
-#         max_tokens=150,
-#         top_p=1.0,
-#         frequency_penalty=0.0,
-#         presence_penalty=0.0,
-#         stream=True,
-#     ),
-#     streaming=False,
-#     callback=modules.PrintModule,
-# )
-
-
-# data = akariRouter.callModule(
-#     moduleType=gemini.LLMModule,
-#     data=akari.AkariData(),
-#     params=gemini.LLMModuleParams(
-#         model="gemini-2.0-flash",
-#         messages=[
-#             Content(role="user", parts=[Part.from_text("Hello, Akari!")]),
-#         ],
-#     ),
-#     streaming=False,
-# )
-
-
-# data = akari.AkariData()
-# dataset = akari.AkariDataSet()
-# with open("input.wav", "rb") as audio_file:
-#     dataset.audio = akari.AkariDataSetType(main=audio_file.read())
-# data.add(dataset)
-# akariRouter.callModule(
-#     moduleType=azure_openai.STTModule,
-#     data=data,
-#     params=azure_openai.STTModuleParams(
-#         model="whisper",
-#         language="ja",
-#         prompt="",
-#         temperature=0.7,
-#     ),
-# )
-
-# data = akariRouter.callModule(
-#     moduleType=azure_openai.TTSModule,
-#     data=akari.AkariData(),
-#     params=azure_openai.TTSModuleParams(
-#         model="gpt-4o-mini-tts",
-#         input="あかりだよ、よろしくね！",
-#         voice="alloy",
-#         instructions="日本語で元気溌剌に話してください",
-#         response_format="wav",
-#         speed=1.0,
-#     ),
-#     streaming=False,
-# )
-
-# with open("output.wav", "wb") as audio_file:
-#     audio_file.write(data.last().audio.main)  # type: ignore
-
-
-# data = akari.AkariData()
-# dataset = akari.AkariDataSet()
-# with open("input.wav", "rb") as audio_file:
-#     dataset.audio = akari.AkariDataSetType(main=audio_file.read())
-# data.add(dataset)
-# akariRouter.callModule(
-#     moduleType=audio.SpeakerModule,
-#     data=data,
-#     params=audio.SpeakerModuleParams(),
-#     streaming=False,
-# )
-
-
-# akariRouter.callModule(
-#     moduleType=audio.MicModule,
-#     data=akari.AkariData(),
-#     params=audio.MicModuleParams(
-#         streamDurationMilliseconds=1000,
-#         destructionMilliseconds=5000,
-#         callbackParams=webrtcvad.WebRTCVadParams(),
-#         callback_callback=modules.PrintModule,
-#     ),
-#     streaming=False,
-#     callback=webrtcvad.WebRTCVadModule,
-# )
-
-### 対話
-# akariRouter.callModule(
-#     moduleType=audio.MicModule,
-#     data=akari.AkariData(),
-#     params=audio.MicModuleParams(
-#         streamDurationMilliseconds=100,
-#         destructionMilliseconds=5000,
-#         # input_device_index=3,
-#         callbackParams=modules.SerialModuleParams(
-#             modules=[
-#                 modules.SerialModuleParamModule(
-#                     moduleType=google.STTModule,
-#                     moduleParams=google.STTModuleParams(
-#                         model="default",
-#                         language="ja-JP",
-#                         prompt="",
-#                         temperature=0.7,
-#                     ),
-#                 ),
-#                 modules.SerialModuleParamModule(
-#                     moduleType=azure_openai.LLMModule,
-#                     moduleParams=azure_openai.LLMModuleParams(
-#                         model="gpt-4o-mini",
-#                         messages_function=lambda data: [
-#                             {
-#                                 "role": "user",
-#                                 "content": (
-#                                     data.last().text.main  # type: ignore
-#                                     if data.last() and data.last().text
-#                                     else "Hello, Akari!"
-#                                 ),
-#                             },
-#                             {"role": "system", "content": "You are a helpful assistant."},
-#                         ],
-#                         temperature=0.7,
-#                     ),
-#                 ),
-#                 modules.SerialModuleParamModule(
-#                     moduleType=azure_openai.TTSModule,
-#                     moduleParams=azure_openai.TTSModuleParams(
-#                         model="gpt-4o-mini-tts",
-#                         voice="alloy",
-#                         instructions="日本語で元気溌剌に話してください",
-#                         speed=1.0,
-#                     ),
-#                 ),
-#                 modules.SerialModuleParamModule(
-#                     moduleType=audio.SpeakerModule,
-#                     moduleParams=audio.SpeakerModuleParams(
-#                         # output_device_index=1,
-#                     ),
-#                 ),
-#             ]
-#         ),
-#         callback_callback=modules.SerialModule,
-#     ),
-#     streaming=False,
-#     callback=modules.SerialModule,
-# )
-
-# akariRouter.callModule(
-#     moduleType=audio.MicModule,
-#     data=akari.AkariData(),
-#     params=audio.MicModuleParams(
-#         streamDurationMilliseconds=100,
-#         destructionMilliseconds=5000,
-#         callbackParams=performance.VADSTTLatencyMeterConfig(
-#             stt_module=google.GoogleSpeechToTextStreamModule,
-#             stt_module_params=google.GoogleSpeechToTextStreamParams(),
-#             vad_module=webrtcvad.WebRTCVadModule,
-#             vad_module_params=webrtcvad.WebRTCVadParams(),
-#             callback_params=modules.SerialModuleParams(
-#                 modules=[
-#                     modules.SerialModuleParamModule(
-#                         moduleType=modules.PrintModule,
-#                         moduleParams=None,
-#                     ),
-#                     # modules.SerialModuleParamModule(
-#                     #     moduleType=azure_openai.LLMModule,
-#                     #     moduleParams=azure_openai.LLMModuleParams(
-#                     #         model="gpt-4o-mini",
-#                     #         messages_function=lambda data: [
-#                     #             {
-#                     #                 "role": "user",
-#                     #                 "content": (
-#                     #                     data.last().text.main  # type: ignore
-#                     #                     if data.last() and data.last().text
-#                     #                     else "Hello, Akari!"
-#                     #                 ),
-#                     #             },
-#                     #             {"role": "system", "content": "You are a helpful assistant."},
-#                     #         ],
-#                     #         temperature=0.7,
-#                     #     ),
-#                     # ),
-#                     # modules.SerialModuleParamModule(
-#                     #     moduleType=azure_openai.TTSModule,
-#                     #     moduleParams=azure_openai.TTSModuleParams(
-#                     #         model="gpt-4o-mini-tts",
-#                     #         voice="alloy",
-#                     #         instructions="日本語で元気溌剌に話してください",
-#                     #         speed=1.0,
-#                     #     ),
-#                     # ),
-#                     # modules.SerialModuleParamModule(
-#                     #     moduleType=audio.SpeakerModule,
-#                     #     moduleParams=audio.SpeakerModuleParams(
-#                     #         # output_device_index=1,
-#                     #     ),
-#                     # ),
-#                 ]
-#             ),
-#         ),
-#         callback_callback=modules.SerialModule,
-#     ),
-#     streaming=False,
-#     callback=performance.VADSTTLatencyMeter,
-# )
-
-data = akari.AkariData()
-dataset = akari.AkariDataSet()
-dataset.text = akari.AkariDataSetType(main="Hello, Akari!")
-data.add(dataset)
-akariRouter.callModule(
-    moduleType=modules.SerialModule,
-    data=data,
-    params=modules.SerialModuleParams(
-        modules=[
-            modules.SerialModuleParamModule(moduleType=modules.PrintModule, moduleParams=None),
-            modules.SerialModuleParamModule(
-                moduleType=google.GoogleTextToSpeechModule,
-                moduleParams=google.GoogleTextToSpeechParams(
-                    voice_name="ja-JP-Chirp3-HD-Kore",
-                    callback_params=audio.SpeakerModuleParams(
-                        # output_device_index=6,
-                    ),
-                ),
-                moduleCallback=audio.SpeakerModule,
-            ),
-        ]
-    ),
-    streaming=False,
-)
-
-# akariRouter.callModule(
-#     moduleType=modules.SerialModule,
-#     data=data,
-#     params=modules.SerialModuleParams(
-#         modules=[
-#             modules.SerialModuleParamModule(moduleType=modules.PrintModule, moduleParams=None),
-#             modules.SerialModuleParamModule(
-#                 moduleType=azure_openai.TTSModule,
-#                 moduleParams=azure_openai.TTSModuleParams(
-#                     model="gpt-4o-mini-tts",
-#                     voice="alloy",
-#                     instructions="日本語で元気溌剌に話してください",
-#                     speed=1.0,
-#                 ),
-#             ),
-#             modules.SerialModuleParamModule(moduleType=audio.SpeakerModule, moduleParams=audio.SpeakerModuleParams()),
-#         ]
-#     ),
-#     streaming=False,
-# )
+
+
+def build_gemini_modules(
+    router: akari.AkariRouter, logger: akari.AkariLogger, credentials: Any
+) -> dict[akari.AkariModuleType, akari.AkariModule]:
+    """Initialize Vertex AI and build the Gemini module.
+
+    Args:
+        router (akari.AkariRouter): The router the modules are registered to.
+        logger (akari.AkariLogger): The logger passed to the modules.
+        credentials (Any): The Google service account credentials.
+
+    Returns:
+        dict[akari.AkariModuleType, akari.AkariModule]: The Gemini module.
+    """
+    import vertexai
+
+    from modules import gemini
+
+    vertexai.init(
+        location=os.getenv("GOOGLE_LOCATION") or "us-central1",
+        credentials=credentials,
+    )
+    return {gemini.LLMModule: gemini.LLMModule(router, logger)}
+
+
+def build_router(logger: akari.AkariLogger, providers: frozenset[str]) -> akari.AkariRouter:
+    """Create the router and register the local modules and those of the given providers.
+
+    Args:
+        logger (akari.AkariLogger): The logger used by the router and the modules.
+        providers (frozenset[str]): The providers whose clients and modules are built.
+
+    Returns:
+        akari.AkariRouter: The sealed router.
+    """
+    router = akari.AkariRouter(
+        logger=logger,
+        options=akari.AkariRouterLoggerOptions(info=False, duration=True),
+    )
+    # プロバイダのクライアント生成 (SDK のインポートや gRPC / HTTPS の準備) は互いに独立しているため並行して行う
+    providerFactories: list[Callable[[], dict[akari.AkariModuleType, akari.AkariModule]]] = []
+    if providers & {"google_stt", "google_tts", "gemini"}:
+        credentials = build_google_credentials()
+        if "google_stt" in providers:
+            providerFactories.append(functools.partial(build_google_stt_modules, router, logger, credentials))
+        if "google_tts" in providers:
+            providerFactories.append(functools.partial(build_google_tts_modules, router, logger, credentials))
+        if "gemini" in providers:
+            providerFactories.append(functools.partial(build_gemini_modules, router, logger, credentials))
+    if "azure_openai" in providers:
+        providerFactories.append(functools.partial(build_azure_openai_modules, router, logger))
+
+    providerModules: dict[akari.AkariModuleType, akari.AkariModule] = {}
+    if providerFactories:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(providerFactories)) as executor:
+            for future in [executor.submit(factory) for factory in providerFactories]:
+                providerModules.update(future.result())
+
+    router.addModules(
+        {
+            modules.RootModule: modules.RootModule(router, logger),
+            modules.PrintModule: modules.PrintModule(router, logger),
+            modules.SerialModule: modules.SerialModule(router, logger),
+            sample.SampleModule: sample.SampleModule(router, logger),
+            audio.SpeakerModule: audio.SpeakerModule(router, logger),
+            audio.MicModule: audio.MicModule(router, logger),
+            webrtcvad.WebRTCVadModule: webrtcvad.WebRTCVadModule(router, logger),
+            io.SaveModule: io.SaveModule(router, logger),
+            performance.VADSTTLatencyMeter: performance.VADSTTLatencyMeter(router, logger),
+            **providerModules,
+        }
+    )
+    router.seal()
+    return router
+
+
+# サブコマンド名 (examples/ 内のモジュール名) と、その実行に必要なプロバイダ
+EXAMPLES: dict[str, frozenset[str]] = {
+    "google_tts": frozenset({"google_tts"}),
+    "root_sample": frozenset(),
+    "azure_openai_llm": frozenset({"azure_openai"}),
+    "azure_openai_stt": frozenset({"azure_openai"}),
+    "azure_openai_tts": frozenset({"azure_openai"}),
+    "azure_openai_serial_tts": frozenset({"azure_openai"}),
+    "gemini_llm": frozenset({"gemini"}),
+    "concurrent_llm_tts": frozenset({"azure_openai", "gemini"}),
+    "speaker": frozenset(),
+    "mic_vad": frozenset(),
+    "conversation": frozenset({"azure_openai"}),
+    "vad_stt_latency": frozenset({"google_stt"}),
+}
+DEFAULT_EXAMPLE = "google_tts"
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Build a router with only the providers the selected example needs and run it.
+
+    Args:
+        argv (Optional[list[str]]): Command-line arguments. Defaults to `sys.argv[1:]`.
+    """
+    parser = argparse.ArgumentParser(description="Run an Akari example pipeline.")
+    subparsers = parser.add_subparsers(dest="example", metavar="EXAMPLE")
+    for name, providers in EXAMPLES.items():
+        subparsers.add_parser(name, help=f"examples/{name}.py (providers: {', '.join(sorted(providers)) or 'none'})")
+    args = parser.parse_args(argv)
+    example: str = args.example or DEFAULT_EXAMPLE
+
+    dotenv.load_dotenv()
+
+    # 共有ハンドラはメッセージのみを出力し、プロセスID・スレッドIDはルーターがメッセージに含めるため、
+    # LogRecord 生成時の呼び出し元探索 (sys._getframe) やスレッド・プロセス情報の取得を省略する
+    logging._srcfile = None
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    akariLogger = akari.getLogger(
+        "Akari",
+        logging.INFO,
+    )
+
+    akariLogger.info("Hello, Akari!")
+
+    # デバイス一覧の取得は PortAudio の初期化を伴うため、明示的に要求された場合のみ、
+    # ルーターの構築と並行してバックグラウンドで行う
+    if os.getenv("AKARI_LIST_DEVICES"):
+        from tools.list_audio_devices import list_audio_devices
+
+        threading.Thread(target=list_audio_devices, args=(akariLogger,), daemon=True).start()
+
+    akariRouter = build_router(akariLogger, enabled_providers(EXAMPLES[example]))
+
+    # 選択された例のモジュールだけをインポートする
+    importlib.import_module(f"examples.{example}").run(akariRouter)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 from .mic import _MicModule as MicModule
 from .mic import _MicModuleParams as MicModuleParams
+from .shared import _getPyAudio as getPyAudio
 from .speaker import _SpeakerModule as SpeakerModule
 from .speaker import _SpeakerModuleParams as SpeakerModuleParams
 
-__all__ = ["SpeakerModule", "SpeakerModuleParams", "MicModule", "MicModuleParams"]
+__all__ = ["SpeakerModule", "SpeakerModuleParams", "MicModule", "MicModuleParams", "getPyAudio"]
@@ -1,4 +1,6 @@
+import collections
 import dataclasses
+import math
 import threading
 import time
 from typing import Any
@@ -16,6 +18,8 @@ from akari import (
     AkariRouter,
 )
 
+from .shared import _getPyAudio
+
 
 @dataclasses.dataclass
 class _MicModuleParams:
@@ -86,7 +90,10 @@ class _MicModule(AkariModule):
             module parameters.
     """
 
-    def __init__(self, router: AkariRouter, logger: AkariLogger) -> None:
+    # 入力の data を変更しないため、ルーターにコピーを省略してもらう
+    requires_isolation = False
+
+    def __init__(self, router: AkariRouter, logger: AkariLogger, audio: pyaudio.PyAudio | None = None) -> None:
         """Constructs a MicModule instance.
 
         Initializes the base AkariModule and prepares a placeholder for managing
@@ -97,8 +104,12 @@ class _MicModule(AkariModule):
                 callback modules.
             logger (AkariLogger): The logger instance for recording operational
                 details and debugging information.
+            audio (Optional[pyaudio.PyAudio]): The PyAudio instance to record with.
+                If `None`, the process-wide instance from `getPyAudio` is used,
+                initialized on the first recording.
         """
         super().__init__(router, logger)
+        self._audio = audio
         self._thread: threading.Thread = threading.Thread()
 
     def call(self, data: AkariData, params: _MicModuleParams, callback: AkariModuleType | None = None) -> AkariDataSet:
@@ -148,7 +159,7 @@ class _MicModule(AkariModule):
         """
         dataset = AkariDataSet()
 
-        audio = pyaudio.PyAudio()
+        audio = self._audio or _getPyAudio()
 
         streamer = audio.open(
             format=params.format,
@@ -161,8 +172,12 @@ class _MicModule(AkariModule):
 
         self._logger.info("Recording started...")
         try:
-            frames = []
-            frame = b""
+            # 直近 destructionMilliseconds 分のフレームだけを保持するスライディングウィンドウ
+            frames: collections.deque[bytes] = collections.deque(
+                maxlen=max(1, math.ceil(params.destructionMilliseconds / params.streamDurationMilliseconds))
+            )
+            # 読み取ったチャンクは bytearray に追記し、bytes の再生成を避ける
+            frame = bytearray()
             frame_time = time.time()
             streamer.start_stream()
 
@@ -172,7 +187,7 @@ class _MicModule(AkariModule):
 
                 current_time = time.time()
                 if current_time - frame_time >= params.streamDurationMilliseconds / 1000:
-                    frames.append(frame)
+                    frames.append(bytes(frame))
 
                     data = AkariData()
                     dataset = AkariDataSet()
@@ -202,12 +217,8 @@ class _MicModule(AkariModule):
                             self._thread.start()
 
                     frame_time = current_time
-                    frame = b""
-
-                if len(frames) >= params.destructionMilliseconds / params.streamDurationMilliseconds:
-                    frames = frames[1:]
+                    frame.clear()
 
         finally:
             streamer.stop_stream()
             streamer.close()
-            audio.terminate()
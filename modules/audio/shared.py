@@ -0,0 +1,28 @@
+import atexit
+import threading
+
+import pyaudio
+
+_instance: pyaudio.PyAudio | None = None
+_lock = threading.Lock()
+
+
+def _getPyAudio() -> pyaudio.PyAudio:
+    """Returns the process-wide PyAudio instance, initializing PortAudio on first use.
+
+    `pyaudio.PyAudio()` runs `Pa_Initialize`, which enumerates every host API
+    and device and can take hundreds of milliseconds. The audio modules share
+    one instance instead of initializing and terminating PortAudio per call.
+    The instance is terminated when the interpreter exits. Devices connected
+    after initialization are not visible to it.
+
+    Returns:
+        pyaudio.PyAudio: The shared PyAudio instance.
+    """
+    global _instance
+    if _instance is None:
+        with _lock:
+            if _instance is None:
+                _instance = pyaudio.PyAudio()
+                atexit.register(_instance.terminate)
+    return _instance
@@ -13,6 +13,8 @@ from akari import (
     AkariRouter,
 )
 
+from .shared import _getPyAudio
+
 
 @dataclasses.dataclass
 class _SpeakerModuleParams:
@@ -54,7 +56,10 @@ class _SpeakerModule(AkariModule):
     streams this data to the chosen audio output using the PyAudio library.
     """
 
-    def __init__(self, router: AkariRouter, logger: AkariLogger) -> None:
+    # 入力の data を変更しないため、ルーターにコピーを省略してもらう
+    requires_isolation = False
+
+    def __init__(self, router: AkariRouter, logger: AkariLogger, audio: pyaudio.PyAudio | None = None) -> None:
         """Constructs a SpeakerModule instance.
 
         Args:
@@ -62,16 +67,21 @@ class _SpeakerModule(AkariModule):
                 initialization (though not directly for playback logic).
             logger (AkariLogger): The logger instance for recording operational
                 details, such as playback errors or informational messages.
+            audio (Optional[pyaudio.PyAudio]): The PyAudio instance to play through.
+                If `None`, the process-wide instance from `getPyAudio` is used,
+                initialized on the first playback.
         """
         super().__init__(router, logger)
+        self._audio = audio
 
     def _play(self, buffer: io.BytesIO, params: _SpeakerModuleParams, channels: int, rate: int) -> None:
         """Handles the low-level audio playback using PyAudio.
 
         Opens a PyAudio output stream configured with the provided parameters.
         It then reads audio data in chunks from the `buffer` and writes these
-        chunks to the stream until the buffer is exhausted. Ensures that PyAudio
-        resources are properly released after playback.
+        chunks to the stream until the buffer is exhausted. Ensures that the
+        stream is closed after playback; the PyAudio instance itself is shared
+        and stays initialized.
 
         Args:
             buffer (io.BytesIO): A byte stream containing the raw audio data to be played.
@@ -80,21 +90,16 @@ class _SpeakerModule(AkariModule):
             channels (int): The number of channels in the audio data.
             rate (int): The sampling rate (in Hz) of the audio data.
         """
-        p = pyaudio.PyAudio()
+        p = self._audio or _getPyAudio()
+        stream = p.open(
+            format=params.format,
+            channels=channels,
+            rate=rate,
+            output=True,
+            frames_per_buffer=params.chunk,
+            **({"output_device_index": params.output_device_index} if params.output_device_index is not None else {}),
+        )
         try:
-            stream = p.open(
-                format=params.format,
-                channels=channels,
-                rate=rate,
-                output=True,
-                frames_per_buffer=params.chunk,
-                **(
-                    {"output_device_index": params.output_device_index}
-                    if params.output_device_index is not None
-                    else {}
-                ),
-            )
-
             sample_width = p.get_sample_size(params.format)
             bytes_per_buffer = sample_width * channels
             audio_data = buffer.read(params.chunk * bytes_per_buffer)
@@ -103,9 +108,8 @@ class _SpeakerModule(AkariModule):
                 audio_data = buffer.read(params.chunk * bytes_per_buffer)
 
             stream.stop_stream()
-            stream.close()
         finally:
-            p.terminate()
+            stream.close()
 
     def _prepare_audio(self, data: AkariData, params: _SpeakerModuleParams) -> tuple[io.BytesIO, int, int]:
         """Extracts and validates audio data and essential playback parameters from an AkariData object.
@@ -1,4 +1,3 @@
-import copy
 import dataclasses
 from typing import Callable, Iterable
 
@@ -112,9 +111,9 @@ class _LLMModule(AkariModule):
         If `params.stream` is True:
             - A `callback` module must be provided.
             - The method iterates through response chunks. Each chunk containing
-              content is appended to a growing `text_main` and added to a list
-              of `texts`. An `AkariDataSet` with the current `text_main` and
-              the stream of `texts` is created and sent to the `callback` module
+              content is appended to a growing `text_main` and to a single
+              `AkariDataStreamType`. An `AkariDataSet` with the current `text_main`
+              and that stream is created and sent to the `callback` module
               via the router in a non-blocking way (though the router call itself might be blocking).
         If `params.stream` is False:
             - The method waits for the full API response.
@@ -132,8 +131,8 @@ class _LLMModule(AkariModule):
                 and streaming preference.
             callback (Optional[AkariModuleType]): The Akari module type to be invoked
                 with each response chunk if `params.stream` is True. This callback
-                module receives a copy of the input `data` augmented with the
-                current streaming `AkariDataSet`.
+                module receives a structural copy (`AkariData.clone`) of the input
+                `data` augmented with the current streaming `AkariDataSet`.
 
         Returns:
             AkariDataSet: An `AkariDataSet` where:
@@ -185,13 +184,15 @@ class _LLMModule(AkariModule):
                             text_main += choice.delta.content if choice.delta.content else ""
                             if choice.delta.content is not None:
                                 texts.append(choice.delta.content)
-                            stream: AkariDataStreamType[str] = AkariDataStreamType(
-                                delta=texts,
-                            )
-                            dataset.text = AkariDataSetType(main=text_main, stream=stream)
                             if callback is not None:
-                                callData = copy.deepcopy(data)
-                                callData.add(dataset)
+                                # 入力の datasets のみを複製する (トークンごとのディープコピーを避ける)
+                                # コールバックごとにその時点のストリームを持つデータセットを渡す
+                                callData = data.clone()
+                                callData.add(
+                                    AkariDataSet(
+                                        text=AkariDataSetType(main=text_main, stream=AkariDataStreamType(texts))
+                                    )
+                                )
                                 self._router.callModule(
                                     moduleType=callback,
                                     data=callData,
@@ -68,6 +68,9 @@ class _STTModule(AkariModule):
     resulting text is then placed back into an AkariDataSet.
     """
 
+    # 入力の data を変更しないため、ルーターにコピーを省略してもらう
+    requires_isolation = False
+
     def __init__(self, router: AkariRouter, logger: AkariLogger, client: AzureOpenAI) -> None:
         """Constructs an _STTModule instance.
 
@@ -119,13 +122,13 @@ class _STTModule(AkariModule):
         if audio is None:
             raise ValueError("Audio data is missing or empty.")
 
-        pcm_buffer = io.BytesIO(audio.main)
         wav_buffer = io.BytesIO()
         with wave.open(wav_buffer, "wb") as wav_file:
             wav_file.setnchannels(params.channels)
             wav_file.setsampwidth(params.sample_width)
             wav_file.setframerate(params.rate)
-            wav_file.writeframes(pcm_buffer.read())
+            # PCM を中間バッファに読み直さず、そのまま WAV に書き込む
+            wav_file.writeframes(audio.main)
 
         wav_buffer.seek(0)
         wav_buffer.name = "input.wav"
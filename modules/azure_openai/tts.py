@@ -1,4 +1,5 @@
 import dataclasses
+import os
 
 from openai import AzureOpenAI
 from typing_extensions import Literal
@@ -38,6 +39,9 @@ class _TTSModuleParams:
         speed (float): Controls the speed of the synthesized speech. Values can
             range from 0.25 (quarter speed) to 4.0 (quadruple speed).
             A value of 1.0 represents normal speed. Defaults to 1.0.
+        output_path (Optional[str | os.PathLike[str]]): If set, the synthesized
+            audio is streamed directly to this file as it arrives instead of
+            being buffered in memory and returned in the dataset. Defaults to `None`.
     """
 
     model: str
@@ -45,6 +49,7 @@ class _TTSModuleParams:
     instructions: str | None
     response_format: Literal["mp3", "opus", "aac", "flac", "wav", "pcm"] = "pcm"
     speed: float = 1.0
+    output_path: str | os.PathLike[str] | None = None
 
 
 class _TTSModule(AkariModule):
@@ -55,6 +60,9 @@ class _TTSModule(AkariModule):
     back into an `AkariDataSet`.
     """
 
+    # 入力の data を変更しないため、ルーターにコピーを省略してもらう
+    requires_isolation = False
+
     def __init__(self, router: AkariRouter, logger: AkariLogger, client: AzureOpenAI) -> None:
         """Constructs an _TTSModule instance.
 
@@ -77,7 +85,9 @@ class _TTSModule(AkariModule):
         model, voice, and other parameters. The binary audio content from the
         response is read and stored in a new `AkariDataSet`. Default audio metadata
         (channels: 1, rate: 24000) is assumed for PCM format; for other formats,
-        this metadata might need external interpretation.
+        this metadata might need external interpretation. If `params.output_path`
+        is set, the response is streamed to that file chunk by chunk and the audio
+        is not kept in memory.
 
         Args:
             data (AkariData): The `AkariData` object from which to retrieve the
@@ -89,10 +99,14 @@ class _TTSModule(AkariModule):
 
         Returns:
             AkariDataSet: An `AkariDataSet` where:
-                - `audio.main` contains the raw bytes of the synthesized audio.
+                - `audio.main` contains the raw bytes of the synthesized audio. If
+                  `params.output_path` is given, `audio` is None and the audio is
+                  only available in the file named by `meta.main["path"]`.
                 - `meta.main` contains a dictionary with default "channels" (1) and
-                  "rate" (24000), primarily relevant for PCM.
-                - `allData` holds the raw response object from the Azure OpenAI API.
+                  "rate" (24000), primarily relevant for PCM, plus "path" when the
+                  audio was written to `params.output_path`.
+                - `allData` holds the raw response object from the Azure OpenAI API,
+                  or None if the audio was written to `params.output_path`.
 
         Raises:
             ValueError: If `data.last().text` is None or does not contain text.
@@ -107,6 +121,22 @@ class _TTSModule(AkariModule):
         if input_data is None:
             raise ValueError("Input data is missing or empty.")
 
+        dataset = AkariDataSet()
+        if params.output_path is not None:
+            # 音声全体をメモリに保持せず、受信したチャンクをそのままファイルへ書き出す
+            with self.client.audio.speech.with_streaming_response.create(
+                model=params.model,
+                input=input_data.main,
+                voice=params.voice,
+                instructions=params.instructions if params.instructions else "",
+                response_format=params.response_format,
+                speed=params.speed,
+            ) as streamed:
+                streamed.stream_to_file(params.output_path)
+            # 応答はコンテキストを抜けた時点で閉じられているため、allData には残さない
+            dataset.meta = AkariDataSetType(main={"channels": 1, "rate": 24000, "path": os.fspath(params.output_path)})
+            return dataset
+
         response = self.client.audio.speech.create(
             model=params.model,
             input=input_data.main,
@@ -116,7 +146,6 @@ class _TTSModule(AkariModule):
             speed=params.speed,
         )
 
-        dataset = AkariDataSet()
         dataset.audio = AkariDataSetType(main=response.read())
         dataset.meta = AkariDataSetType(main={"channels": 1, "rate": 24000})
         dataset.allData = response
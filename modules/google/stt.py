@@ -51,6 +51,9 @@ class _GoogleSpeechToTextStreamModule(AkariModule):
     指定されたコールバックモジュールに送信します。
     """
 
+    # 入力の data を変更しないため、ルーターにコピーを省略してもらう
+    requires_isolation = False
+
     def __init__(self, router: AkariRouter, logger: AkariLogger, client: speech.SpeechClient) -> None:
         """GoogleSpeechToTextStreamModuleを初期化します.
 
@@ -87,7 +90,7 @@ class _GoogleSpeechToTextStreamModule(AkariModule):
             except queue.Empty:
                 continue
             except Exception as e:
-                self._logger.error(f"Error in audio chunk provider: {e}")
+                self._logger.error("Error in audio chunk provider: %s", e)
                 return
         self._logger.debug("Audio chunk provider loop finished.")
 
@@ -120,7 +123,7 @@ class _GoogleSpeechToTextStreamModule(AkariModule):
                 transcript = result.alternatives[0].transcript
                 is_final = result.is_final
 
-                self._logger.debug(f"STT Result: '{transcript}' (Final: {is_final})")
+                self._logger.debug("STT Result: '%s' (Final: %s)", transcript, is_final)
 
                 # 逐次レスポンス保存
                 if transcript:
@@ -152,10 +155,10 @@ class _GoogleSpeechToTextStreamModule(AkariModule):
                             streaming=True,
                         )
                     except Exception as e_router:
-                        self._logger.error(f"Error calling downstream callback module: {e_router}")
+                        self._logger.error("Error calling downstream callback module: %s", e_router)
 
         except Exception as e:
-            self._logger.error(f"Exception in Google STT processing thread: {e}", exc_info=True)
+            self._logger.error("Exception in Google STT processing thread: %s", e, exc_info=True)
         finally:
             self._logger.info("Google STT processing thread finished.")
             with self._lock:
@@ -250,7 +253,7 @@ class _GoogleSpeechToTextStreamModule(AkariModule):
             TypeError: `params` が `GoogleSpeechToTextStreamParams` 型でない場合。
         """
         if not isinstance(params, _GoogleSpeechToTextStreamParams):
-            self._logger.error(f"Invalid params type: {type(params)}. Expected GoogleSpeechToTextStreamParams.")
+            self._logger.error("Invalid params type: %s. Expected GoogleSpeechToTextStreamParams.", type(params))
             # Akariの規約上、型エラーは呼び出し側の責任だが、安全のためエラーを返す
             error_dataset = AkariDataSet()
             error_dataset.text = AkariDataSetType(main="Error: Invalid parameters type for STT module.")
@@ -266,14 +269,15 @@ class _GoogleSpeechToTextStreamModule(AkariModule):
                     self._logger.info("Received end_stream_flag but STT session was not active.")
                 return AkariDataSet()
 
-            if data.datasets:
+            if len(data):
                 last_dataset = data.last()
                 if last_dataset.meta and last_dataset.meta.main and "rate" in last_dataset.meta.main:
                     actual_sample_rate = last_dataset.meta.main["rate"]
                     if current_params.sample_rate_hertz != actual_sample_rate:
                         self._logger.warning(
-                            f"Overriding params.sample_rate_hertz ({current_params.sample_rate_hertz}) "
-                            f"with actual sample rate from metadata ({actual_sample_rate})."
+                            "Overriding params.sample_rate_hertz (%s) with actual sample rate from metadata (%s).",
+                            current_params.sample_rate_hertz,
+                            actual_sample_rate,
                         )
                         current_params.sample_rate_hertz = actual_sample_rate
 
@@ -281,7 +285,7 @@ class _GoogleSpeechToTextStreamModule(AkariModule):
                 self._start_streaming_session(current_params, callback)
 
             audio_chunk: bytes | None = None
-            if data.datasets:
+            if len(data):
                 last_dataset = data.last()
                 if last_dataset.audio:
                     if last_dataset.audio.stream and len(last_dataset.audio.stream) > 0:
@@ -292,14 +296,14 @@ class _GoogleSpeechToTextStreamModule(AkariModule):
             if audio_chunk:
                 if self._is_streaming_active:
                     self._audio_queue.put(audio_chunk)
-                    self._logger.debug(f"Added audio chunk of size {len(audio_chunk)} to queue.")
+                    self._logger.debug("Added audio chunk of size %d to queue.", len(audio_chunk))
                 else:
                     self._logger.warning("Received audio chunk, but STT session is not active. Chunk ignored.")
             else:
                 self._logger.debug("No audio chunk found in AkariData.")
 
         dataset = AkariDataSet()
-        stream = AkariDataStreamType(delta=self._result_delta.copy())
+        stream = AkariDataStreamType(delta=self._result_delta)
         dataset.text = AkariDataSetType(
             main=self._result_delta[-1] if len(self._result_delta) > 0 else "",
             stream=stream,
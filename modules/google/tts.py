@@ -1,7 +1,12 @@
-import copy
 import dataclasses
+import hashlib
+import os
+import pathlib
+import struct
+import tempfile
 import threading
 import typing
+import unicodedata
 
 from google.cloud import texttospeech  # Corrected import alias
 
@@ -31,9 +36,73 @@ class _GoogleTextToSpeechParams:
 
 
 class _GoogleTextToSpeechModule(AkariModule):
-    def __init__(self, router: AkariRouter, logger: AkariLogger, client: texttospeech.TextToSpeechClient):
+    # 入力の data を変更しないため、ルーターにコピーを省略してもらう
+    requires_isolation = False
+
+    def __init__(
+        self,
+        router: AkariRouter,
+        logger: AkariLogger,
+        client: texttospeech.TextToSpeechClient,
+        cache_dir: str | os.PathLike[str] | None = None,
+    ):
         super().__init__(router, logger)
         self._client = client
+        # 同じ入力に対する合成結果をディスクに保存し、再合成の RPC を省略する (None の場合は無効)
+        self._cache_dir = pathlib.Path(cache_dir) if cache_dir is not None else None
+
+    def _cache_path(self, text: str, params: _GoogleTextToSpeechParams, streaming: bool) -> pathlib.Path | None:
+        if self._cache_dir is None:
+            return None
+        # ストリーミング合成はヘッダなしの PCM を返すため、通常の合成とはキーを分ける
+        # 先頭の版数はキャッシュファイルの形式を変えたときに古いエントリを読まないためのもの
+        key = repr(
+            (
+                2,
+                streaming,
+                params.language_code,
+                params.voice_name,
+                params.speaking_rate,
+                params.pitch,
+                params.audio_encoding,
+                params.sample_rate_hertz,
+                params.effects_profile_id,
+                unicodedata.normalize("NFKC", text).strip(),
+            )
+        )
+        return self._cache_dir / f"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}.bin"
+
+    # キャッシュファイルの先頭にはサンプルレート (不明な場合は 0) を格納する
+    _CACHE_HEADER = struct.Struct("<I")
+
+    def _read_cache(self, path: pathlib.Path | None) -> tuple[bytes, int | None] | None:
+        if path is None:
+            return None
+        try:
+            content = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            self._logger.warning("Failed to read Google TTS cache %s: %s", path, e)
+            return None
+        header = self._CACHE_HEADER
+        if len(content) <= header.size:
+            self._logger.warning("Ignoring truncated Google TTS cache %s", path)
+            return None
+        (rate,) = header.unpack_from(content)
+        return content[header.size :], rate or None
+
+    def _write_cache(self, path: pathlib.Path | None, audio: bytes, rate: int | None) -> None:
+        if path is None or not audio:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as f:
+                f.write(self._CACHE_HEADER.pack(rate or 0))
+                f.write(audio)
+            os.replace(f.name, path)
+        except OSError as e:
+            self._logger.warning("Failed to write Google TTS cache %s: %s", path, e)
 
     def call(
         self,
@@ -52,6 +121,9 @@ class _GoogleTextToSpeechModule(AkariModule):
             result_dataset.text = AkariDataSetType(main="Error: No text provided for synthesis.")
             return result_dataset
 
+        cache_path = self._cache_path(input_text, params, streaming=callback is not None)
+        cached = self._read_cache(cache_path)
+
         try:
             synthesis_input = texttospeech.SynthesisInput(text=input_text)
 
@@ -67,15 +139,27 @@ class _GoogleTextToSpeechModule(AkariModule):
                 audio_config_args["effects_profile_id"] = params.effects_profile_id
 
             if callback is None:
-                audio_config = texttospeech.AudioConfig(**audio_config_args)
+                if cached is not None:
+                    audio_content, rate = cached
+                else:
+                    audio_config = texttospeech.AudioConfig(**audio_config_args)
 
-                response = self._client.synthesize_speech(
-                    input=synthesis_input, voice=voice_params, audio_config=audio_config
-                )
+                    response = self._client.synthesize_speech(
+                        input=synthesis_input, voice=voice_params, audio_config=audio_config
+                    )
+                    audio_content = response.audio_content
+                    rate = None
+                    if (
+                        hasattr(response, "audio_config")
+                        and response.audio_config
+                        and hasattr(response.audio_config, "sample_rate_hertz")
+                    ):
+                        rate = response.audio_config.sample_rate_hertz
+                    self._write_cache(cache_path, audio_content, rate)
 
                 # Successful return structure as per instructions
                 result_dataset = AkariDataSet()
-                result_dataset.audio = AkariDataSetType(main=response.audio_content)
+                result_dataset.audio = AkariDataSetType(main=audio_content)
                 meta_info = {
                     "language_code": params.language_code,
                     "voice_name": params.voice_name,
@@ -83,12 +167,8 @@ class _GoogleTextToSpeechModule(AkariModule):
                     "pitch": params.pitch,
                     "audio_encoding": params.audio_encoding,
                 }
-                if (
-                    hasattr(response, "audio_config")
-                    and response.audio_config
-                    and hasattr(response.audio_config, "sample_rate_hertz")
-                ):
-                    meta_info["rate"] = response.audio_config.sample_rate_hertz
+                if rate is not None:
+                    meta_info["rate"] = rate
                 elif params.sample_rate_hertz:
                     meta_info["rate"] = params.sample_rate_hertz
                 meta_info["channels"] = 1
@@ -111,13 +191,21 @@ class _GoogleTextToSpeechModule(AkariModule):
 
                 delta_bytes = []
                 try:
-                    streaming_responses = self._client.streaming_synthesize(request_generator())
-                    for response in streaming_responses:
-                        if hasattr(response, "audio_content") and response.audio_content:
-                            b = response.audio_content
+                    # キャッシュがあれば全体を1チャンクとしてコールバックに渡す
+                    chunks: typing.Iterable[bytes] = (
+                        [cached[0]]
+                        if cached is not None
+                        else (
+                            response.audio_content
+                            for response in self._client.streaming_synthesize(request_generator())
+                            if hasattr(response, "audio_content") and response.audio_content
+                        )
+                    )
+                    for b in chunks:
+                        if b:
                             delta_bytes.append(b)
                             result_dataset = AkariDataSet()
-                            stream = AkariDataStreamType(delta=delta_bytes.copy())
+                            stream = AkariDataStreamType(delta=delta_bytes)
                             result_dataset.audio = AkariDataSetType(
                                 main=b"".join(delta_bytes),
                                 stream=stream,
@@ -134,7 +222,7 @@ class _GoogleTextToSpeechModule(AkariModule):
                             meta_info["channels"] = 1
                             result_dataset.meta = AkariDataSetType(main=meta_info)
 
-                            callback_data = copy.deepcopy(data)
+                            callback_data = data.clone()
                             callback_data.add(result_dataset)
 
                             self._router.callModule(
@@ -145,9 +233,11 @@ class _GoogleTextToSpeechModule(AkariModule):
                                 streaming=True,
                             )
 
+                    if cached is None:
+                        self._write_cache(cache_path, b"".join(delta_bytes), params.sample_rate_hertz)
                     return result_dataset
                 except Exception as e:
-                    self._logger.error(f"Error during Google TTS streaming synthesis: {e}")
+                    self._logger.error("Error during Google TTS streaming synthesis: %s", e)
                     result_dataset = AkariDataSet()
                     result_dataset.text = AkariDataSetType(
                         main=f"Error: Google TTS streaming synthesis failed: {str(e)}"
@@ -156,7 +246,7 @@ class _GoogleTextToSpeechModule(AkariModule):
 
         except Exception as e:
             # Error handling as per instructions
-            self._logger.error(f"Error during Google TTS synthesis: {e}")
+            self._logger.error("Error during Google TTS synthesis: %s", e)
             result_dataset = AkariDataSet()
             result_dataset.text = AkariDataSetType(main=f"Error: Google TTS synthesis failed: {str(e)}")
             return result_dataset
@@ -52,6 +52,9 @@ class _SaveModule(AkariModule):
     header information based on provided metadata.
     """
 
+    # 入力の data を変更しないため、ルーターにコピーを省略してもらう
+    requires_isolation = False
+
     def __init__(
         self,
         router: AkariRouter,
@@ -91,9 +94,9 @@ class _SaveModule(AkariModule):
                 parameter is currently not used by the SaveModule.
 
         Returns:
-            AkariDataSet: The last `AkariDataSet` from the input `data` object.
-            This module does not modify the dataset itself but returns it to
-            maintain pipeline flow.
+            AkariDataSet: A shallow copy of the last `AkariDataSet` from the input
+            `data` object. This module does not modify the dataset itself but
+            returns a copy of it to maintain pipeline flow.
 
         Raises:
             ValueError: If `params.save_from_data` does not correspond to a valid
@@ -102,10 +105,10 @@ class _SaveModule(AkariModule):
             wave.Error: If writing a WAV file fails due to incorrect audio
                 parameters or data.
         """
-        try:
-            save_data = data.last().__dict__[params.save_from_data]
-        except KeyError:
+        last = data.last()
+        if params.save_from_data not in last.__slots__:
             raise ValueError(f"Data does not contain the key '{params.save_from_data}'.")
+        save_data = getattr(last, params.save_from_data)
         if not save_data:
             raise ValueError(f"Data does not contain the key '{params.save_from_data}' or it is empty.")
 
@@ -119,8 +122,8 @@ class _SaveModule(AkariModule):
                 path = f"{path}_{timestamp}"
 
         if path.endswith(".wav") and params.save_from_data == "audio":
-            audio_data: AkariDataSetType[bytes] = data.last().__dict__[params.save_from_data]
-            meta: AkariDataSetType[dict[str, Any]] | None = data.last().meta
+            audio_data: AkariDataSetType[bytes] = save_data
+            meta: AkariDataSetType[dict[str, Any]] | None = last.meta
             with wave.open(path, "wb") as wav_file:
                 wav_file.setnchannels(meta.main["channels"] if meta and "channels" in meta.main else 1)
                 wav_file.setsampwidth(meta.main["sample_width"] if meta and "sample_width" in meta.main else 2)
@@ -129,10 +132,10 @@ class _SaveModule(AkariModule):
             self._logger.debug("Audio data saved as WAV to %s", path)
         else:
             with open(path, "wb") as file:
-                file.write(data.last().__dict__[params.save_from_data].main)
+                file.write(save_data.main)
             self._logger.debug("Data saved to %s", path)
 
-        return data.last()
+        return last.clone()
 
     def stream_call(
         self, data: AkariData, params: _SaveModuleParams, callback: AkariModuleType | None = None
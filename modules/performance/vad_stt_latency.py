@@ -43,8 +43,8 @@ class _VADSTTLatencyMeter(AkariModule):
 
     def __init__(self, router: AkariRouter, logger: AkariLogger):
         super().__init__(router, logger)
-        self._vad_start_time: Optional[float] = None
-        self._vad_end_time: Optional[float] = None
+        self._vad_start_time: Optional[int] = None
+        self._vad_end_time: Optional[int] = None
         self._is_vad_end: bool = True
 
     def call(
@@ -61,36 +61,35 @@ class _VADSTTLatencyMeter(AkariModule):
             bool_data = vad_data.last().bool
             flag = bool_data.main if bool_data else None
             if flag and self._vad_start_time is None and self._is_vad_end:
-                self._vad_start_time = time.perf_counter()
+                self._vad_start_time = time.perf_counter_ns()
                 self._is_vad_end = False
             if not flag:
                 if not self._is_vad_end:
-                    self._vad_end_time = time.perf_counter()
+                    self._vad_end_time = time.perf_counter_ns()
                 self._is_vad_end = True
                 self._vad_start_time = None
 
         thread1 = None
         if self._vad_start_time is None:
-            thread1 = threading.Thread(target=vad_func, args=(data,))
+            # STT モジュールの結果は data に追加されるため、並行して動く VAD スレッドには別のコピーを渡す
+            thread1 = threading.Thread(target=vad_func, args=(data.clone(),))
             thread1.start()
 
         stt_data = self._router.callModule(params.stt_module, data, params.stt_module_params, True, None)
 
         dataset = stt_data.last()
-        now = time.perf_counter()
-        dataset.setModule(
-            AkariDataModuleType(
-                _VADSTTLatencyMeter,
-                params,
-                True,
-                callback,
-                (
-                    self._vad_end_time
-                    if self._vad_end_time is not None
-                    else self._vad_start_time if self._vad_start_time is not None else now
-                ),
-                now,
-            )
+        now = time.perf_counter_ns()
+        dataset.module = AkariDataModuleType(
+            _VADSTTLatencyMeter,
+            params,
+            True,
+            callback,
+            (
+                self._vad_end_time
+                if self._vad_end_time is not None
+                else self._vad_start_time if self._vad_start_time is not None else now
+            ),
+            now,
         )
 
         if dataset.text and dataset.text.main == "":
@@ -104,8 +103,7 @@ class _VADSTTLatencyMeter(AkariModule):
             if callback:
                 self._router.callModule(callback, data, params.callback_params, True, None)
 
-        data.add(dataset)
-        thread2 = threading.Thread(target=callback_func, args=(data,))
+        thread2 = threading.Thread(target=callback_func, args=(stt_data,))
         thread2.start()
 
         return dataset
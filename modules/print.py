@@ -21,6 +21,9 @@ class _PrintModule(AkariModule):
     and individual fields.
     """
 
+    # 入力の data を変更しないため、ルーターにコピーを省略してもらう
+    requires_isolation = False
+
     def __init__(self, router: AkariRouter, logger: AkariLogger) -> None:
         """Constructs a PrintModule instance.
 
@@ -55,8 +58,8 @@ class _PrintModule(AkariModule):
                 Currently, this parameter is logged but not used.
 
         Returns:
-            AkariDataSet: The same last dataset that was inspected. This module
-            does not modify the data.
+            AkariDataSet: A shallow copy of the last dataset that was inspected.
+            This module does not modify the data.
         """
         self._logger.debug("PrintModule called")
         self._logger.debug("Data: %s", data)
@@ -68,8 +71,8 @@ class _PrintModule(AkariModule):
         except:
             self._logger.info("Last Data: %s", last)
 
-        for field in last.__dict__:
-            if hasattr(last, field) and field != "module":
+        for field in last.__slots__:
+            if field != "module":
                 value = getattr(last, field)
                 if isinstance(value, AkariDataSetType):
                     if value.main is not None:
@@ -78,13 +81,15 @@ class _PrintModule(AkariModule):
                     if value is not None:
                         self._logger.info("%s: %s", field, value)
 
-        return data.last()
+        return last.clone()
 
     def stream_call(self, data: AkariData, params: Any, callback: AkariModuleType | None = None) -> AkariDataSet:
-        """Processes streaming data by applying the same logging logic as the non-streaming `call` method.
+        """Logs the newest chunk of a text stream as it arrives.
 
-        This module treats streaming and non-streaming calls identically,
-        logging the content of the last dataset received.
+        If the last dataset carries a text stream (e.g. tokens forwarded by a
+        streaming LLM), only the most recent delta is logged, so each token is
+        written once instead of re-logging the accumulated text on every chunk.
+        Otherwise the same logging logic as the non-streaming `call` is applied.
 
         Args:
             data (AkariData): The AkariData object, typically containing the latest
@@ -94,6 +99,12 @@ class _PrintModule(AkariModule):
                 (logged but not used).
 
         Returns:
-            AkariDataSet: The last dataset from the input AkariData object.
+            AkariDataSet: A shallow copy of the last dataset from the input AkariData object.
         """
-        return self.call(data, params, callback)
+        last = data.last()
+        text = last.text
+        if text is None or not text.stream:
+            return self.call(data, params, callback)
+
+        self._logger.info("text: %s", text.stream.last())
+        return last.clone()
@@ -74,6 +74,9 @@ class _SerialModule(AkariModule):
         For each module defined in `params.modules`, this method invokes the
         module using the AkariRouter. The `AkariData` object is updated with the
         result of each module call and then passed as input to the subsequent module.
+        The router hands the module a copy of the input, so the caller's `data`
+        is left unchanged; room for one new dataset per configured module is
+        reserved up front.
         The `callback` argument passed to this `call` method is not used by the
         SerialModule itself during the execution of the sequence.
 
@@ -91,6 +94,7 @@ class _SerialModule(AkariModule):
             AkariData: The AkariData object after it has been processed by all
             modules in the configured sequence.
         """
+        data.reserve(len(data) + len(params.modules))
         for module in params.modules:
             data = self._router.callModule(
                 moduleType=module.moduleType,
@@ -124,6 +128,7 @@ class _SerialModule(AkariModule):
         Returns:
             AkariData: The AkariData object after processing by all modules in the sequence.
         """
+        data.reserve(len(data) + len(params.modules))
         for module in params.modules:
             data = self._router.callModule(
                 moduleType=module.moduleType,
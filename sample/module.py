@@ -10,6 +10,9 @@ from akari import (
 
 
 class _SampleModule(AkariModule):
+    # 入力の data を変更しないため、ルーターにコピーを省略してもらう
+    requires_isolation = False
+
     def __init__(self, router: AkariRouter, logger: AkariLogger) -> None:
         super().__init__(router, logger)
 
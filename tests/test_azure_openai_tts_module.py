@@ -0,0 +1,47 @@
+import os
+import pathlib
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+
+from akari import (
+    AkariData,
+    AkariDataSet,
+    AkariDataSetType,
+    AkariLogger,
+    AkariRouter,
+)
+
+pytest.importorskip("openai")
+
+from modules.azure_openai import TTSModule, TTSModuleParams  # noqa: E402
+
+
+class _StreamedResponse:
+    def __enter__(self) -> "_StreamedResponse":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def stream_to_file(self, path: str | os.PathLike[str]) -> None:
+        pathlib.Path(path).write_bytes(b"audio")
+
+
+def test_call_with_output_path_writes_file_and_keeps_no_response(tmp_path: pathlib.Path) -> None:
+    logger = AkariLogger("test.azure_openai.tts")
+    speech = SimpleNamespace(with_streaming_response=SimpleNamespace(create=lambda **kwargs: _StreamedResponse()))
+    client = SimpleNamespace(audio=SimpleNamespace(speech=speech))
+    module = TTSModule(AkariRouter(logger=logger), logger, cast(Any, client))
+    data = AkariData()
+    data.add(AkariDataSet(text=AkariDataSetType("Hello")))
+    output_path = tmp_path / "out.pcm"
+
+    result = module.call(data, TTSModuleParams(model="tts-1", voice="alloy", instructions=None, output_path=output_path))
+
+    assert output_path.read_bytes() == b"audio"
+    assert result.audio is None
+    assert result.allData is None
+    assert result.meta is not None
+    assert result.meta.main["path"] == os.fspath(output_path)
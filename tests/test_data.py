@@ -0,0 +1,171 @@
+
+import pytest
+
+from akari import AkariData, AkariDataSet, AkariDataSetType, AkariDataStreamType
+
+
+def test_stream_append_updates_last() -> None:
+    stream: AkariDataStreamType[str] = AkariDataStreamType(["a"])
+
+    stream.append("b")
+
+    assert len(stream) == 2
+    assert stream.last() == "b"
+    assert stream[0] == "a"
+
+
+def test_stream_discards_oldest_beyond_maxlen() -> None:
+    stream: AkariDataStreamType[int] = AkariDataStreamType(range(3), maxlen=3)
+
+    stream.append(3)
+
+    assert len(stream) == 3
+    assert stream[0] == 1
+    assert stream.last() == 3
+
+
+def test_stream_keeps_every_point_by_default() -> None:
+    stream: AkariDataStreamType[int] = AkariDataStreamType(range(2048))
+
+    stream.append(2048)
+
+    assert len(stream) == 2049
+    assert stream[0] == 0
+
+
+def test_stream_copies_initial_delta() -> None:
+    source = [b"x"]
+    stream: AkariDataStreamType[bytes] = AkariDataStreamType(source)
+
+    source.append(b"y")
+
+    assert len(stream) == 1
+
+
+def test_reserved_data_counts_only_added_datasets() -> None:
+    data = AkariData()
+    data.reserve(3)
+    first = AkariDataSet()
+    second = AkariDataSet()
+
+    data.add(first)
+    data.add(second)
+
+    assert len(data) == 2
+    assert data.last() is second
+    assert data[1] is second
+    assert data.datasets == [first, second]
+    with pytest.raises(IndexError):
+        data.get(2)
+
+
+def test_reading_datasets_keeps_reserved_slots() -> None:
+    data = AkariData()
+    data.reserve(3)
+    data.add(AkariDataSet())
+
+    assert len(data.datasets) == 1
+    assert len(data._datasets) == 3
+
+
+def test_changing_datasets_copy_does_not_desync() -> None:
+    data = AkariData()
+    first = AkariDataSet()
+    data.add(first)
+
+    data.datasets.append(AkariDataSet())
+    del data.datasets[0]
+
+    assert len(data) == 1
+    assert data.last() is first
+
+
+def test_assigning_datasets_replaces_contents() -> None:
+    data = AkariData()
+    data.reserve(3)
+    data.add(AkariDataSet())
+    first = AkariDataSet()
+    second = AkariDataSet()
+
+    data.datasets = [first, second]
+
+    assert len(data) == 2
+    assert data.last() is second
+    data.add(AkariDataSet())
+    assert len(data) == 3
+
+
+def test_reserved_empty_data_has_no_datasets() -> None:
+    data = AkariData()
+    data.reserve(3)
+
+    assert not data.datasets
+    with pytest.raises(IndexError):
+        data.last()
+
+
+def test_stream_index_errors() -> None:
+    stream: AkariDataStreamType[str] = AkariDataStreamType([])
+
+    with pytest.raises(IndexError, match="No history available"):
+        stream.last()
+    with pytest.raises(IndexError, match="Index out of range"):
+        stream[0]
+
+
+def test_stream_rejects_negative_index() -> None:
+    stream: AkariDataStreamType[str] = AkariDataStreamType(["a", "b"])
+
+    with pytest.raises(IndexError, match="Index out of range"):
+        stream[-1]
+
+
+def test_dataset_type_others_promoted_on_first_write() -> None:
+    first: AkariDataSetType[str] = AkariDataSetType("a")
+    second: AkariDataSetType[str] = AkariDataSetType("b")
+
+    first.set_other("lang", "ja")
+
+    assert first.others == {"lang": "ja"}
+    assert second.others == {}
+    assert second.clone() == second
+
+
+def test_dataset_type_set_other_replaces_existing_key() -> None:
+    audio: AkariDataSetType[bytes] = AkariDataSetType(b"", others={"all": b"a"})
+
+    audio.set_other("alt", b"b")
+    audio.set_other("all", b"c")
+
+    assert list(audio.others.items()) == [("all", b"c"), ("alt", b"b")]
+    assert audio.others["alt"] == b"b"
+    assert audio.clone() == audio
+    with pytest.raises(KeyError):
+        audio.others["missing"]
+
+
+def test_dataset_accepts_fields_as_keywords() -> None:
+    text: AkariDataSetType[str] = AkariDataSetType("hello")
+
+    dataset = AkariDataSet(text=text)
+
+    assert dataset.text is text
+    assert dataset.audio is None
+    assert dataset != AkariDataSet(text=text)
+
+
+def test_data_clone_is_structurally_independent() -> None:
+    text: AkariDataSetType[str] = AkariDataSetType("hello")
+    data = AkariData()
+    data.reserve(3)
+    data.add(AkariDataSet(text=text))
+
+    cloned = data.clone()
+    cloned.last().text = None
+    cloned.add(AkariDataSet())
+
+    assert len(data) == 1
+    assert data.last().text is text
+    assert len(cloned) == 2
+    assert len(cloned.datasets) == 2
+    assert cloned[0] is not data[0]
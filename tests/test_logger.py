@@ -0,0 +1,45 @@
+import logging
+
+from akari import getLogger
+
+
+def test_get_logger_does_not_duplicate_handlers() -> None:
+    first = getLogger("test.logger.handlers", logging.INFO)
+    second = getLogger("test.logger.handlers", logging.INFO)
+    third = getLogger("test.logger.handlers", logging.DEBUG)
+
+    assert first is second is third
+    assert len(third.handlers) == 1
+
+
+def test_get_logger_shares_one_handler() -> None:
+    first = getLogger("test.logger.shared.first")
+    second = getLogger("test.logger.shared.second")
+
+    assert first.handlers == second.handlers
+    assert first.handlers[0] is second.handlers[0]
+    assert not first.propagate
+
+
+def test_get_logger_without_stream_propagates() -> None:
+    logger = getLogger("Akari.test.silent", stream=False)
+
+    assert logger.handlers == []
+    assert logger.propagate
+    assert logging.getLogger("Akari").handlers
+
+
+def test_get_logger_reapplies_level() -> None:
+    getLogger("test.logger.level", logging.INFO)
+    getLogger("test.logger.level", logging.DEBUG)
+    logger = getLogger("test.logger.level", logging.INFO)
+
+    assert logger.level == logging.INFO
+
+
+def test_get_logger_detaches_stream() -> None:
+    getLogger("test.logger.detach", stream=True)
+    logger = getLogger("test.logger.detach", stream=False)
+
+    assert logger.handlers == []
+    assert logger.propagate
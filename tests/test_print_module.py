@@ -0,0 +1,46 @@
+import logging
+
+import pytest
+
+from akari import (
+    AkariData,
+    AkariDataSet,
+    AkariDataSetType,
+    AkariDataStreamType,
+    AkariLogger,
+    AkariRouter,
+)
+from modules import PrintModule
+
+
+@pytest.fixture
+def logger(caplog: pytest.LogCaptureFixture) -> AkariLogger:
+    logger = AkariLogger("test.print")
+    logger.addHandler(caplog.handler)
+    caplog.set_level(logging.DEBUG)
+    return logger
+
+
+@pytest.fixture
+def print_module(logger: AkariLogger) -> PrintModule:
+    return PrintModule(AkariRouter(logger=logger), logger)
+
+
+def test_stream_call_logs_only_newest_delta(print_module: PrintModule, caplog: pytest.LogCaptureFixture) -> None:
+    stream: AkariDataStreamType[str] = AkariDataStreamType(["Hello", ", Akari"])
+    data = AkariData()
+    data.add(AkariDataSet(text=AkariDataSetType("Hello, Akari", stream=stream)))
+
+    result = print_module.stream_call(data, None)
+
+    assert [record.getMessage() for record in caplog.records] == ["text: , Akari"]
+    assert result.text is data.last().text
+
+
+def test_stream_call_without_stream_logs_dataset(print_module: PrintModule, caplog: pytest.LogCaptureFixture) -> None:
+    data = AkariData()
+    data.add(AkariDataSet(text=AkariDataSetType("Hello")))
+
+    print_module.stream_call(data, None)
+
+    assert "text: Hello" in [record.getMessage() for record in caplog.records]
@@ -0,0 +1,356 @@
+import asyncio
+import dataclasses
+import logging
+import threading
+from typing import Any
+
+import pytest
+
+from akari import (
+    AkariData,
+    AkariDataSet,
+    AkariDataSetType,
+    AkariDataStreamType,
+    AkariLogger,
+    AkariModule,
+    AkariModuleParams,
+    AkariModuleType,
+    AkariRouter,
+    AkariRouterLoggerOptions,
+)
+from modules import RootModule
+from modules.performance import VADSTTLatencyMeter, VADSTTLatencyMeterConfig
+
+
+class _CustomDataSet(AkariDataSet):
+    pass
+
+
+class _ReturnParamModule(AkariModule):
+    def call(
+        self, data: AkariData, params: AkariModuleParams, callback: AkariModuleType | None = None
+    ) -> AkariDataSet | AkariData:
+        result: Any = params
+        return result  # type: ignore[no-any-return]
+
+
+class _CustomModule(_ReturnParamModule):
+    pass
+
+
+@dataclasses.dataclass
+class _AppendParams:
+    isolate: bool
+
+
+class _AppendModule(AkariModule):
+    def call(
+        self, data: AkariData, params: AkariModuleParams, callback: AkariModuleType | None = None
+    ) -> AkariDataSet | AkariData:
+        data.add(AkariDataSet())
+        return data
+
+
+class _PassThroughAppendModule(_AppendModule):
+    requires_isolation = False
+
+
+class _MutatingModule(AkariModule):
+    def call(
+        self, data: AkariData, params: AkariModuleParams, callback: AkariModuleType | None = None
+    ) -> AkariDataSet | AkariData:
+        last = data.last()
+        assert last.text is not None and last.text.stream is not None and last.meta is not None
+        last.text.main = "changed"
+        last.text.stream.append("changed")
+        last.text.set_other("changed", "changed")
+        last.meta.main["changed"] = True
+        last.audio = AkariDataSetType(b"changed")
+        data.add(AkariDataSet())
+        return AkariDataSet()
+
+
+class _Undeepcopyable:
+    def __deepcopy__(self, memo: dict[int, Any]) -> "_Undeepcopyable":
+        raise TypeError("payload must not be deep-copied")
+
+
+class _StreamModule(_ReturnParamModule):
+    def stream_call(
+        self, data: AkariData, params: AkariModuleParams, callback: AkariModuleType | None = None
+    ) -> AkariDataSet | AkariData:
+        return AkariDataSet()
+
+
+@pytest.fixture
+def logger() -> AkariLogger:
+    return AkariLogger("test")
+
+
+@pytest.fixture
+def router(logger: AkariLogger) -> AkariRouter:
+    router = AkariRouter(logger=logger)
+    router.addModules(
+        {
+            _ReturnParamModule: _ReturnParamModule(router, logger),
+            _AppendModule: _AppendModule(router, logger),
+            _PassThroughAppendModule: _PassThroughAppendModule(router, logger),
+            _MutatingModule: _MutatingModule(router, logger),
+        }
+    )
+    return router
+
+
+def test_call_module_records_module_on_dataset(router: AkariRouter) -> None:
+    dataset = AkariDataSet()
+
+    result = router.callModule(_ReturnParamModule, AkariData(), dataset, False)
+
+    assert result.last() is dataset
+    assert dataset.module is not None
+    assert dataset.module.moduleType is _ReturnParamModule
+
+
+def test_call_module_accepts_dataset_subclass(router: AkariRouter) -> None:
+    dataset = _CustomDataSet()
+
+    result = router.callModule(_ReturnParamModule, AkariData(), dataset, False)
+
+    assert result.last() is dataset
+    assert dataset.module is not None
+
+
+def test_call_module_rejects_invalid_result(router: AkariRouter) -> None:
+    with pytest.raises(ValueError, match="Invalid result type"):
+        router.callModule(_ReturnParamModule, AkariData(), "not data", False)
+
+
+def test_module_without_call_is_rejected() -> None:
+    with pytest.raises(TypeError, match="must override call"):
+
+        class _Incomplete(AkariModule):
+            pass
+
+
+def test_abstract_module_base_may_leave_call_to_subclasses() -> None:
+    class _Base(AkariModule, abstract=True):
+        pass
+
+    with pytest.raises(TypeError, match="must override call"):
+
+        class _Incomplete(_Base):
+            pass
+
+
+def test_call_module_rejects_unregistered_module(logger: AkariLogger) -> None:
+    with pytest.raises(ValueError, match="not found in router"):
+        AkariRouter(logger=logger).callModule(_ReturnParamModule, AkariData(), AkariDataSet(), False)
+
+
+def test_module_uses_class_logger_by_default(router: AkariRouter, logger: AkariLogger) -> None:
+    shared = _ReturnParamModule(router)
+    other = _ReturnParamModule(router)
+    overridden = _ReturnParamModule(router, logger)
+
+    assert shared._logger is other._logger
+    assert shared._logger.name == "Akari._ReturnParamModule"
+    assert shared._logger.level == logging.NOTSET
+    assert overridden._logger is logger
+
+
+def test_sealed_router_rejects_new_modules(router: AkariRouter, logger: AkariLogger) -> None:
+    router.seal()
+
+    with pytest.raises(ValueError, match="sealed"):
+        router.addModules({_CustomModule: _CustomModule(router, logger)})
+    assert router.callModule(_ReturnParamModule, AkariData(), AkariDataSet(), False)
+
+
+@pytest.mark.parametrize("isolate", [False, True])
+def test_call_module_passes_input_through_only_when_declared(router: AkariRouter, isolate: bool) -> None:
+    data = AkariData()
+
+    result = router.callModule(_PassThroughAppendModule, data, _AppendParams(isolate=isolate), False)
+
+    assert len(result) == 1
+    assert (result is data) is not isolate
+    assert len(data) == (0 if isolate else 1)
+
+
+def test_mutating_module_cannot_corrupt_caller_data(router: AkariRouter) -> None:
+    stream: AkariDataStreamType[str] = AkariDataStreamType(["a"])
+    text = AkariDataSetType("original", stream=stream)
+    meta: AkariDataSetType[dict[str, Any]] = AkariDataSetType({"rate": 16000})
+    dataset = AkariDataSet(text=text, meta=meta)
+    data = AkariData()
+    data.add(dataset)
+
+    router.callModule(_MutatingModule, data, None, False)
+
+    assert len(data) == 2
+    assert data[0] is dataset
+    assert dataset.text is text
+    assert text.main == "original"
+    assert len(stream) == 1
+    assert not text.others
+    assert meta.main == {"rate": 16000}
+    assert dataset.audio is None
+
+
+def test_call_module_skips_metadata_when_timings_disabled(logger: AkariLogger) -> None:
+    router = AkariRouter(logger=logger, options=AkariRouterLoggerOptions(record_timings=False))
+    router.addModules({_ReturnParamModule: _ReturnParamModule(router, logger)})
+    dataset = AkariDataSet()
+
+    router.callModule(_ReturnParamModule, AkariData(), dataset, False)
+
+    assert dataset.module is None
+
+
+def test_add_modules_rejects_duplicates_atomically(router: AkariRouter, logger: AkariLogger) -> None:
+    with pytest.raises(ValueError, match="already exists"):
+        router.addModules(
+            {
+                _CustomModule: _CustomModule(router, logger),
+                _ReturnParamModule: _ReturnParamModule(router, logger),
+            }
+        )
+
+    with pytest.raises(ValueError, match="not found"):
+        router.callModule(_CustomModule, AkariData(), AkariDataSet(), False)
+
+
+def test_stream_scope_records_one_metadata_for_whole_stream(router: AkariRouter, logger: AkariLogger) -> None:
+    router.addModules({_StreamModule: _StreamModule(router, logger)})
+
+    with router.streamScope(_StreamModule, None) as scope:
+        data = scope.call(AkariData())
+        data = scope.call(data)
+
+    assert len(data) == 2
+    assert data[0].module is None
+    module = data[1].module
+    assert module is not None
+    assert module.streaming
+    assert module.endTime >= module.startTime
+
+
+def test_stream_scope_records_metadata_when_stream_fails(logger: AkariLogger) -> None:
+    router = AkariRouter(logger=logger)
+    router.addModules({_StreamModule: _StreamModule(router, logger)})
+
+    with pytest.raises(RuntimeError):
+        with router.streamScope(_StreamModule, None) as scope:
+            data = scope.call(AkariData())
+            raise RuntimeError("stream interrupted")
+
+    assert data.last().module is not None
+
+
+@pytest.mark.parametrize("moduleType", [_AppendModule, _PassThroughAppendModule])
+def test_call_module_never_deep_copies_payloads(router: AkariRouter, moduleType: AkariModuleType) -> None:
+    payload = _Undeepcopyable()
+    data = AkariData()
+    data.add(AkariDataSet(allData=payload))
+
+    result = router.callModule(moduleType, data, None, False)
+
+    assert result[0].allData is payload
+    assert len(result) == 2
+    assert len(data) == (1 if moduleType.requires_isolation else 2)
+
+
+def test_root_module_adds_only_its_own_dataset(router: AkariRouter, logger: AkariLogger) -> None:
+    router.addModules({RootModule: RootModule(router, logger)})
+    data = AkariData()
+    first = AkariDataSet()
+    data.add(first)
+
+    result = router.callModule(RootModule, data, _AppendModule, False)
+
+    assert result is data
+    assert len(data) == 2
+    assert data.datasets[0] is first
+
+
+def test_vad_stt_latency_meter_adds_stt_dataset_once(router: AkariRouter, logger: AkariLogger) -> None:
+    inputs: dict[str, AkariData] = {}
+
+    class _STTModule(_ReturnParamModule):
+        def stream_call(
+            self, data: AkariData, params: AkariModuleParams, callback: AkariModuleType | None = None
+        ) -> AkariDataSet | AkariData:
+            inputs["stt"] = data
+            return AkariDataSet(text=AkariDataSetType("Hello"))
+
+    class _VADModule(_ReturnParamModule):
+        def stream_call(
+            self, data: AkariData, params: AkariModuleParams, callback: AkariModuleType | None = None
+        ) -> AkariDataSet | AkariData:
+            inputs["vad"] = data
+            return AkariDataSet(bool=AkariDataSetType(False))
+
+    router.addModules(
+        {
+            VADSTTLatencyMeter: VADSTTLatencyMeter(router, logger),
+            _STTModule: _STTModule(router, logger),
+            _VADModule: _VADModule(router, logger),
+        }
+    )
+    data = AkariData()
+    first = AkariDataSet()
+    data.add(first)
+    params = VADSTTLatencyMeterConfig(
+        stt_module=_STTModule,
+        stt_module_params=None,
+        vad_module=_VADModule,
+        vad_module_params=None,
+        callback_params=None,
+    )
+
+    router.callModule(VADSTTLatencyMeter, data, params, True)
+
+    assert len(data) == 2
+    assert data.datasets[0] is first
+    assert first.text is None
+    text = data.last().text
+    assert text is not None
+    assert text.main == "Hello"
+    assert inputs["vad"] is not inputs["stt"]
+
+
+def test_duration_log_carries_structured_fields(logger: AkariLogger, caplog: pytest.LogCaptureFixture) -> None:
+    router = AkariRouter(logger=logger, options=AkariRouterLoggerOptions(duration=True))
+    router.addModules({_ReturnParamModule: _ReturnParamModule(router, logger)})
+
+    logger.addHandler(caplog.handler)
+    caplog.set_level(logging.INFO)
+    router.callModule(_ReturnParamModule, AkariData(), AkariDataSet(), False)
+
+    (record,) = caplog.records
+    assert record.__dict__["akari_mode"] == "calling"
+    assert record.__dict__["akari_module"] == "_ReturnParamModule"
+    assert record.__dict__["akari_duration_ms"] >= 0
+
+
+def test_call_module_async_runs_off_the_event_loop(router: AkariRouter) -> None:
+    threads: list[int] = []
+
+    class _ThreadModule(_ReturnParamModule):
+        def call(
+            self, data: AkariData, params: AkariModuleParams, callback: AkariModuleType | None = None
+        ) -> AkariDataSet | AkariData:
+            threads.append(threading.get_ident())
+            return super().call(data, params, callback)
+
+    router.addModules({_ThreadModule: _ThreadModule(router)})
+    dataset = AkariDataSet()
+
+    async def run() -> AkariData:
+        threads.append(threading.get_ident())
+        return await router.callModuleAsync(_ThreadModule, AkariData(), dataset, False)
+
+    result = asyncio.run(run())
+
+    assert result.last() is dataset
+    assert threads[0] != threads[1]
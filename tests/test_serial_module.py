@@ -62,3 +62,23 @@ def test_serial_module_call(fakegen: Faker, router: AkariRouter) -> None:
     assert result.datasets[0].text == dataset.text
     for i in range(1, 4):
         assert isinstance(result.datasets[i], AkariDataSet)
+
+
+def test_serial_module_leaves_caller_data_unchanged(fakegen: Faker, router: AkariRouter) -> None:
+    data = AkariData()
+    dataset = AkariDataSet()
+    dataset.text = AkariDataSetType(fakegen.word())
+    data.add(dataset)
+
+    serial_module_params = SerialModuleParams(
+        modules=[
+            SerialModuleParamModule(moduleType=PrintModule, moduleParams={}, moduleCallback=None),
+            SerialModuleParamModule(moduleType=PrintModule, moduleParams={}, moduleCallback=None),
+        ]
+    )
+
+    result = router.callModule(SerialModule, data, serial_module_params, False, None)
+
+    assert result is not data
+    assert len(data) == 1
+    assert data.last() is dataset
@@ -0,0 +1,34 @@
+import pytest
+
+from akari import (
+    AkariData,
+    AkariDataSet,
+    AkariDataSetType,
+    AkariDataStreamType,
+    AkariLogger,
+    AkariRouter,
+)
+
+pytest.importorskip("pyaudio")
+pytest.importorskip("webrtcvad")
+
+from modules.webrtcvad import WebRTCVadModule, WebRTCVadParams  # noqa: E402
+
+
+def test_stream_call_leaves_caller_data_unchanged() -> None:
+    logger = AkariLogger("test.webrtcvad")
+    router = AkariRouter(logger=logger)
+    router.addModules({WebRTCVadModule: WebRTCVadModule(router, logger)})
+    frame = b"\x00" * 960
+    stream: AkariDataStreamType[bytes] = AkariDataStreamType([frame])
+    dataset = AkariDataSet(audio=AkariDataSetType(frame, stream=stream))
+    data = AkariData()
+    data.add(dataset)
+
+    result = router.callModule(WebRTCVadModule, data, WebRTCVadParams(), True)
+
+    assert result is not data
+    assert len(result) == 2
+    assert len(data) == 1
+    assert data.last() is dataset
+    assert len(stream) == 1
@@ -0,0 +1,46 @@
+import logging
+
+import pyaudio
+
+import akari
+from modules.audio import getPyAudio
+
+
+def list_audio_devices(logger: akari.AkariLogger, audio: pyaudio.PyAudio | None = None) -> None:
+    """Enumerates and logs details of all audio devices discoverable by PyAudio.
+
+    Queries PyAudio for available audio hardware.
+    For each detected device, it logs its unique index, human-readable name,
+    maximum number of input channels, and maximum number of output channels.
+    This utility is helpful for debugging audio configurations or allowing
+    users to select specific audio devices. Nothing is queried when the
+    logger is not enabled for INFO.
+
+    Run it directly with `python -m tools.list_audio_devices`, or set the
+    `AKARI_LIST_DEVICES` environment variable to have `main.py` call it at
+    startup.
+
+    Args:
+        logger (akari.AkariLogger): The logger the device details are written to.
+        audio (Optional[pyaudio.PyAudio]): The PyAudio instance to query. If `None`,
+            the process-wide instance from `modules.audio.getPyAudio` is used, so
+            the audio modules do not initialize PortAudio again afterwards.
+    """
+    # ログが出力されない場合は PortAudio の初期化自体を省略する
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    p = audio or getPyAudio()
+    for i in range(p.get_device_count()):
+        info = p.get_device_info_by_index(i)
+        logger.info(
+            "Device %d: %s (Input: %d, Output: %d)",
+            i,
+            info["name"],
+            info["maxInputChannels"],
+            info["maxOutputChannels"],
+        )
+
+
+if __name__ == "__main__":
+    list_audio_devices(akari.getLogger("Akari", logging.INFO))